@@ -10,6 +10,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Dict, List, Tuple
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from packages.core.base_graph import BaseGraph
     from packages.graphs.simple_graph import SimpleGraph
 
@@ -37,25 +39,15 @@ def to_adjacency_dict(graph: BaseGraph) -> Dict[Any, Dict[Any, float]]:
         >>> data["A"]["B"]
         5.0
     """
-    adj_dict: Dict[Any, Dict[Any, float]] = {}
-
     # Initialize dict for all vertices to ensure isolated vertices are included
-    for vertex in graph.vertices():
-        adj_dict[vertex.id] = {}
+    adj_dict: Dict[Any, Dict[Any, float]] = {vertex.id: {} for vertex in graph.vertices()}
+    undirected = not graph.is_directed()
 
-    # Fill edges
+    # Fill edges. For multigraphs, later parallel edges overwrite earlier ones;
+    # this function assumes simple structure logic.
     for edge in graph.edges():
-        if edge.source not in adj_dict:
-            adj_dict[edge.source] = {}
-        
-        # For multigraphs, this might overwrite previous edges with the last one found.
-        # This function assumes simple structure logic.
         adj_dict[edge.source][edge.target] = edge.weight
-
-        # If undirected, ensure symmetry
-        if not graph.is_directed():
-            if edge.target not in adj_dict:
-                adj_dict[edge.target] = {}
+        if undirected:
             adj_dict[edge.target][edge.source] = edge.weight
 
     return adj_dict
@@ -85,28 +77,56 @@ def from_adjacency_dict(
 
     graph = SimpleGraph(directed=directed)
 
-    # 1. Add all vertices first
-    for source_id in data:
-        if not graph.has_vertex(source_id):
-            graph.add_vertex(source_id)
-        
-        for target_id in data[source_id]:
-            if not graph.has_vertex(target_id):
-                graph.add_vertex(target_id)
-
-    # 2. Add edges
-    for source_id, neighbors in data.items():
-        for target_id, weight in neighbors.items():
-            # For undirected graphs, avoid adding the edge twice
-            if not directed and graph.has_edge(target_id, source_id):
-                continue
-            
-            if not graph.has_edge(source_id, target_id):
-                graph.add_edge(source_id, target_id, weight=weight)
+    # 1. Collect every vertex id once (ordered, duplicates collapsed by hashing)
+    vertex_ids = dict.fromkeys(data)
+    for neighbors in data.values():
+        vertex_ids.update(dict.fromkeys(neighbors))
+
+    # Bind the mutators once instead of resolving them per iteration
+    add_vertex = graph.add_vertex
+    add_edge = graph.add_edge
+
+    with graph.bulk_mutation():
+        for vertex_id in vertex_ids:
+            add_vertex(vertex_id)
+
+        # 2. Add edges; undirected pairs listed from both sides are added once
+        seen: set[frozenset[Any]] = set()
+        for source_id, neighbors in data.items():
+            for target_id, weight in neighbors.items():
+                if not directed:
+                    key = frozenset((source_id, target_id))
+                    if key in seen:
+                        continue
+                    seen.add(key)
+
+                add_edge(source_id, target_id, weight=weight)
 
     return graph
 
 
+def to_edge_list_iter(graph: BaseGraph) -> Iterator[tuple[Any, Any, float]]:
+    """
+    Lazily yield (source, target, weight) tuples for every edge.
+
+    Use this instead of to_edge_list_tuples when the edges are consumed
+    once (e.g. written to a file) and the full list is not needed.
+
+    Args:
+        graph: The source graph.
+
+    Yields:
+        (source, target, weight) tuples.
+
+    Examples:
+        >>> graph = SimpleGraph()
+        >>> graph.add_edge("A", "B", weight=3.0)
+        >>> next(to_edge_list_iter(graph))
+        ('A', 'B', 3.0)
+    """
+    return ((edge.source, edge.target, edge.weight) for edge in graph.edges())
+
+
 def to_edge_list_tuples(graph: BaseGraph) -> List[Tuple[Any, Any, float]]:
     """
     Convert graph to a list of (source, target, weight) tuples.
@@ -123,7 +143,4 @@ def to_edge_list_tuples(graph: BaseGraph) -> List[Tuple[Any, Any, float]]:
         >>> to_edge_list_tuples(graph)
         [('A', 'B', 3.0)]
     """
-    result = []
-    for edge in graph.edges():
-        result.append((edge.source, edge.target, edge.weight))
-    return result
\ No newline at end of file
+    return [(edge.source, edge.target, edge.weight) for edge in graph.edges()]
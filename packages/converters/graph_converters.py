@@ -7,13 +7,27 @@ while preserving as much structure as possible.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import operator
+from typing import TYPE_CHECKING, Any, Final
+
+from packages.core.edge import Edge
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
     from packages.graphs.multigraph import Multigraph
     from packages.graphs.pseudograph import Pseudograph
     from packages.graphs.simple_graph import SimpleGraph
 
+# Pairwise reducers applied as parallel edges stream in; "avg" accumulates a
+# running sum with this reducer and divides by the count at the end.
+_MERGE_REDUCERS: Final[dict[str, Callable[[float, float], float]]] = {
+    "min": min,
+    "max": max,
+    "sum": operator.add,
+    "avg": operator.add,
+}
+
 
 def simple_to_multigraph(simple: SimpleGraph) -> Multigraph:
     """
@@ -36,16 +50,82 @@ def simple_to_multigraph(simple: SimpleGraph) -> Multigraph:
     from packages.graphs.multigraph import Multigraph
 
     multi = Multigraph(directed=simple.is_directed())
+    multi.bulk_load(simple.vertices(), simple.edges())
+    return multi
 
-    # Copy vertices
-    for vertex in simple.vertices():
-        multi.add_vertex(vertex.id, **vertex.attributes)
 
-    # Copy edges
-    for edge in simple.edges():
-        multi.add_edge(edge.source, edge.target, weight=edge.weight, **edge.attributes)
+def _directed_key(edge: Edge) -> tuple[Any, Any]:
+    """Return the (source, target) pair of a directed edge."""
+    return (edge.source, edge.target)
 
-    return multi
+
+def _undirected_key_factory() -> Callable[[Edge], tuple[Any, Any]]:
+    """
+    Build a key function that maps both orientations of a pair to one key.
+
+    The first orientation seen for an unordered pair becomes its key.
+    """
+    seen: dict[frozenset[Any], tuple[Any, Any]] = {}
+
+    def key_of(edge: Edge) -> tuple[Any, Any]:
+        pair = (edge.source, edge.target)
+        return seen.setdefault(frozenset(pair), pair)
+
+    return key_of
+
+
+def _merge_parallel_edges(
+    edges: Iterable[Edge],
+    merge_strategy: str,
+    *,
+    directed: bool,
+) -> dict[tuple[Any, Any], float]:
+    """
+    Reduce parallel edge weights per (source, target) pair in a single pass.
+
+    Only one running value is kept per pair (a ``[sum, count]`` pair for
+    "avg"), so the weights of parallel edges are never collected in lists.
+    Each edge costs a single ``dict.get`` probe plus at most one store.
+
+    For undirected input, A-B and B-A are the same pair; the orientation
+    seen first is the one returned.
+
+    Args:
+        edges: Edges to merge
+        merge_strategy: One of "min", "max", "sum", "avg"
+        directed: Whether (A, B) and (B, A) are distinct pairs
+
+    Returns:
+        Mapping of (source, target) -> merged weight, in first-seen order
+
+    Raises:
+        ValueError: If merge_strategy is invalid
+    """
+    reduce = _MERGE_REDUCERS.get(merge_strategy)
+    if reduce is None:
+        msg = f"Invalid merge_strategy: {merge_strategy!r}"
+        raise ValueError(msg)
+
+    key_of = _directed_key if directed else _undirected_key_factory()
+
+    if merge_strategy == "avg":
+        totals: dict[tuple[Any, Any], list[float]] = {}
+        for edge in edges:
+            key = key_of(edge)
+            total = totals.get(key)
+            if total is None:
+                totals[key] = [edge.weight, 1]
+            else:
+                total[0] = reduce(total[0], edge.weight)
+                total[1] += 1
+        return {key: total / count for key, (total, count) in totals.items()}
+
+    merged: dict[tuple[Any, Any], float] = {}
+    for edge in edges:
+        key = key_of(edge)
+        current = merged.get(key)
+        merged[key] = edge.weight if current is None else reduce(current, edge.weight)
+    return merged
 
 
 def multigraph_to_simple(multi: Multigraph, *, merge_strategy: str = "min") -> SimpleGraph:
@@ -77,38 +157,19 @@ def multigraph_to_simple(multi: Multigraph, *, merge_strategy: str = "min") -> S
     """
     from packages.graphs.simple_graph import SimpleGraph
 
-    if merge_strategy not in {"min", "max", "sum", "avg"}:
-        msg = f"Invalid merge_strategy: {merge_strategy!r}"
-        raise ValueError(msg)
-
-    simple = SimpleGraph(directed=multi.is_directed())
-
-    # Copy vertices
-    for vertex in multi.vertices():
-        simple.add_vertex(vertex.id, **vertex.attributes)
+    directed = multi.is_directed()
+    simple = SimpleGraph(directed=directed)
 
     # Merge parallel edges
-    edge_weights: dict[tuple[Any, Any], list[float]] = {}
-
-    for edge in multi.edges():
-        key = (edge.source, edge.target)
-        if key not in edge_weights:
-            edge_weights[key] = []
-        edge_weights[key].append(edge.weight)
-
-    # Apply merge strategy
-    for (source, target), weights in edge_weights.items():
-        if merge_strategy == "min":
-            weight = min(weights)
-        elif merge_strategy == "max":
-            weight = max(weights)
-        elif merge_strategy == "sum":
-            weight = sum(weights)
-        elif merge_strategy == "avg":
-            weight = sum(weights) / len(weights)
-
-        simple.add_edge(source, target, weight=weight)
-
+    merged = _merge_parallel_edges(multi.edges(), merge_strategy, directed=directed)
+
+    simple.bulk_load(
+        multi.vertices(),
+        (
+            Edge(source=source, target=target, weight=weight, directed=directed)
+            for (source, target), weight in merged.items()
+        ),
+    )
     return simple
 
 
@@ -129,6 +190,9 @@ def pseudograph_to_simple(
     Returns:
         New SimpleGraph instance
 
+    Raises:
+        ValueError: If merge_strategy is invalid
+
     Examples:
         >>> pseudo = Pseudograph()
         >>> pseudo.add_edge("A", "A", weight=1.0)  # Self-loop
@@ -143,37 +207,21 @@ def pseudograph_to_simple(
     """
     from packages.graphs.simple_graph import SimpleGraph
 
-    simple = SimpleGraph(directed=pseudo.is_directed())
-
-    # Copy vertices
-    for vertex in pseudo.vertices():
-        simple.add_vertex(vertex.id, **vertex.attributes)
-
-    # Merge edges, excluding self-loops
-    edge_weights: dict[tuple[Any, Any], list[float]] = {}
-
-    for edge in pseudo.edges():
-        # Skip self-loops if requested
-        if remove_loops and edge.is_self_loop():
-            continue
-
-        key = (edge.source, edge.target)
-        if key not in edge_weights:
-            edge_weights[key] = []
-        edge_weights[key].append(edge.weight)
-
-    # Apply merge strategy
-    merge_funcs = {
-        "min": min,
-        "max": max,
-        "sum": sum,
-        "avg": lambda ws: sum(ws) / len(ws),
-    }
+    directed = pseudo.is_directed()
+    simple = SimpleGraph(directed=directed)
 
-    merge_func = merge_funcs[merge_strategy]
+    # Merge edges, excluding self-loops if requested
+    edges = pseudo.edges()
+    if remove_loops:
+        edges = (edge for edge in edges if edge.source != edge.target)
 
-    for (source, target), weights in edge_weights.items():
-        weight = merge_func(weights)
-        simple.add_edge(source, target, weight=weight)
+    merged = _merge_parallel_edges(edges, merge_strategy, directed=directed)
 
+    simple.bulk_load(
+        pseudo.vertices(),
+        (
+            Edge(source=source, target=target, weight=weight, directed=directed)
+            for (source, target), weight in merged.items()
+        ),
+    )
     return simple
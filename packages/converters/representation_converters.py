@@ -28,15 +28,18 @@ class RepresentationConverter:
         Convert a graph to use a different internal representation.
 
         Creates a new graph instance of the same type (Simple, Multi, etc.)
-        but with the specified storage strategy.
+        but with the specified storage strategy. If the graph already uses
+        the requested representation, it is returned unchanged (not copied).
 
         Args:
             graph: The source graph instance.
             target_representation: The target representation type.
-                Options: "adjacency_list", "adjacency_matrix", "edge_list".
+                Options: "adjacency_list", "adjacency_matrix", "edge_list"
+                (multigraphs and pseudographs also accept "multigraph").
 
         Returns:
-            A new graph instance with the requested representation.
+            A graph instance with the requested representation; ``graph``
+            itself when no conversion is needed.
 
         Raises:
             ValueError: If the target representation is unknown.
@@ -48,6 +51,9 @@ class RepresentationConverter:
             >>> matrix_graph.has_edge("A", "B")
             True
         """
+        if graph._representation.kind == target_representation:
+            return graph
+
         # Create a new instance of the same graph class (SimpleGraph, Multigraph, etc.)
         # We pass the new representation string to the constructor.
         new_graph = graph.__class__(
@@ -55,19 +61,6 @@ class RepresentationConverter:
             representation=target_representation,
         )
 
-        # 1. Copy Vertices and their attributes
-        for vertex in graph.vertices():
-            new_graph.add_vertex(vertex.id, **vertex.attributes)
-
-        # 2. Copy Edges and their attributes
-        for edge in graph.edges():
-            # Check for duplicates if converting to a representation that might
-            # handle them differently, though the Graph class logic usually handles this.
-            new_graph.add_edge(
-                edge.source,
-                edge.target,
-                weight=edge.weight,
-                **edge.attributes,
-            )
-
+        # Vertices and edges are immutable, so they are shared with the source
+        new_graph.bulk_load(graph.vertices(), graph.edges())
         return new_graph
\ No newline at end of file
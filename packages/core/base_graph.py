@@ -12,10 +12,13 @@ This module implements the foundation of the graph library using SOLID principle
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Iterator
+from collections.abc import Mapping
+from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
     from packages.core.edge import Edge
     from packages.core.vertex import Vertex
     from packages.representations.base_representation import GraphRepresentation
@@ -36,6 +39,7 @@ class BaseGraph(ABC, Generic[V, E]):
         _representation: Strategy pattern - the internal representation of the graph
         _directed: Whether the graph is directed
         _observers: List of observers for change notifications (Observer pattern)
+        _suppress_observers: True while inside bulk_mutation()
 
     Type Parameters:
         V: Type of vertices (constrained to Vertex or its subclasses)
@@ -48,7 +52,13 @@ class BaseGraph(ABC, Generic[V, E]):
         >>> graph.add_edge("A", "B", weight=5.0)
     """
 
-    __slots__ = ("_representation", "_directed", "_observers", "_metadata")
+    __slots__ = (
+        "_representation",
+        "_directed",
+        "_observers",
+        "_suppress_observers",
+        "_metadata",
+    )
 
     def __init__(
         self,
@@ -72,6 +82,7 @@ class BaseGraph(ABC, Generic[V, E]):
         self._directed = directed
         self._representation: GraphRepresentation = self._create_representation(representation)
         self._observers: list[Any] = []
+        self._suppress_observers = False
         self._metadata: dict[str, Any] = kwargs
 
     @abstractmethod
@@ -94,16 +105,26 @@ class BaseGraph(ABC, Generic[V, E]):
         ...
 
     @abstractmethod
-    def add_vertex(self, vertex_id: V, **attributes: Any) -> None:
+    def add_vertex(
+        self,
+        vertex_id: V,
+        *,
+        attributes: dict[str, Any] | None = None,
+        **extra: Any,
+    ) -> None:
         """
         Add a vertex to the graph.
 
+        Each call notifies observers; wrap large loads in bulk_mutation().
+
         Args:
             vertex_id: Unique identifier for the vertex
-            **attributes: Arbitrary key-value pairs for vertex metadata
+            attributes: Metadata dict, stored by reference without copying
+            **extra: Arbitrary key-value pairs for vertex metadata
 
         Raises:
             ValueError: If vertex already exists or violates graph constraints
+            TypeError: If attributes is not a mapping
         """
         ...
 
@@ -114,20 +135,25 @@ class BaseGraph(ABC, Generic[V, E]):
         target: V,
         *,
         weight: float = 1.0,
-        **attributes: Any,
+        attributes: dict[str, Any] | None = None,
+        **extra: Any,
     ) -> None:
         """
         Add an edge to the graph.
 
+        Each call notifies observers; wrap large loads in bulk_mutation().
+
         Args:
             source: Source vertex identifier
             target: Target vertex identifier
             weight: Edge weight (default: 1.0)
-            **attributes: Arbitrary key-value pairs for edge metadata
+            attributes: Metadata dict, stored by reference without copying
+            **extra: Arbitrary key-value pairs for edge metadata
 
         Raises:
             ValueError: If edge violates graph constraints (e.g., self-loop in simple graph)
             KeyError: If source or target vertex doesn't exist
+            TypeError: If attributes is not a mapping
         """
         ...
 
@@ -253,15 +279,107 @@ class BaseGraph(ABC, Generic[V, E]):
         Get weight of edge between source and target.
         Returns weight of first edge found if multiple exist.
         """
-        return self.get_edge(source, target).weight
+        return self._representation.get_edge_weight(source, target)
 
     def vertex_count(self) -> int:
-        """Get total number of vertices."""
-        return len(list(self.vertices()))
+        """
+        Get total number of vertices.
+
+        Time Complexity: O(1) - delegated to the representation, which
+        tracks its own size.
+        """
+        return self._representation.vertex_count()
 
     def edge_count(self) -> int:
-        """Get total number of edges."""
-        return len(list(self.edges()))
+        """
+        Get total number of edges.
+
+        Time Complexity: O(1) - delegated to the representation, which
+        tracks its own size.
+        """
+        return self._representation.edge_count()
+
+    def bulk_load(self, vertices: Iterable[Vertex], edges: Iterable[E]) -> None:
+        """
+        Load many vertices and edges in one call.
+
+        This is the fast path used by converters. Vertex and Edge objects are
+        passed to the representation as-is (they are immutable, so they can
+        be shared with the graph they came from). Storage is reserved up
+        front, and observers receive a single "bulk_loaded" event instead
+        of one event per element. Graph-type constraints such as "no
+        self-loops" are still enforced.
+
+        Args:
+            vertices: Vertex objects to add
+            edges: Edge objects of this graph's edge type (Hyperedge for
+                hypergraphs); their endpoints must be among the graph's
+                vertices and their direction should match the graph
+
+        Raises:
+            ValueError: If a vertex or edge already exists
+            GraphConstraintError: If an edge violates graph constraints
+            KeyError: If an edge endpoint doesn't exist
+
+        Examples:
+            >>> copy = SimpleGraph()
+            >>> copy.bulk_load(graph.vertices(), graph.edges())
+        """
+        vertices = list(vertices)
+        edges = list(edges)
+        for edge in edges:
+            self._check_edge_constraints(edge)
+
+        self._representation.reserve(len(vertices), len(edges))
+        self._representation.bulk_load(vertices, edges)
+        self._notify_observers("bulk_loaded", len(vertices), len(edges))
+
+    @staticmethod
+    def _merge_attributes(
+        attributes: dict[str, Any] | None,
+        extra: dict[str, Any],
+    ) -> dict[str, Any]:
+        """
+        Combine an explicit attributes dict with keyword metadata.
+
+        The explicit dict is returned as-is when no keywords are given, so
+        copying elements between graphs doesn't rebuild every dict. Other
+        mappings are copied into a dict.
+
+        Args:
+            attributes: Explicit metadata mapping, if any
+            extra: Keyword metadata; wins on key conflicts
+
+        Returns:
+            Attributes dict to store
+
+        Raises:
+            TypeError: If attributes is not a mapping
+        """
+        if attributes is None:
+            return extra
+        if not isinstance(attributes, dict):
+            if not isinstance(attributes, Mapping):
+                msg = f"attributes must be a mapping, got {type(attributes).__name__}"
+                raise TypeError(msg)
+            attributes = dict(attributes)
+        if extra:
+            return {**attributes, **extra}
+        return attributes
+
+    def _check_edge_constraints(self, edge: E) -> None:
+        """
+        Validate an edge against this graph type's structural constraints.
+
+        The default accepts every edge; graph types with restrictions
+        (e.g. no self-loops) override it.
+
+        Args:
+            edge: Edge about to be added
+
+        Raises:
+            GraphConstraintError: If the edge violates a constraint
+        """
 
     def get_vertices(self) -> list[V]:
         """Get list of all vertex IDs."""
@@ -288,15 +406,13 @@ class BaseGraph(ABC, Generic[V, E]):
             >>> graph = SimpleGraph(representation="adjacency_list")
             >>> graph.convert_representation("adjacency_matrix")
         """
-        if new_repr_type == type(self._representation).__name__.lower():
+        if new_repr_type == self._representation.kind:
             return  # Already using this representation
 
         # Create new representation and transfer data
         new_repr = self._create_representation(new_repr_type)
-        for vertex in self.vertices():
-            new_repr.add_vertex(vertex)
-        for edge in self.edges():
-            new_repr.add_edge(edge)
+        new_repr.reserve(self.vertex_count(), self.edge_count())
+        new_repr.bulk_load(self.vertices(), self.edges())
 
         self._representation = new_repr
         self._notify_observers("representation_changed", new_repr_type)
@@ -309,8 +425,44 @@ class BaseGraph(ABC, Generic[V, E]):
         """Detach an observer."""
         self._observers.remove(observer)
 
+    @contextmanager
+    def bulk_mutation(self) -> Iterator[None]:
+        """
+        Group many mutations into a single observer notification.
+
+        Per-element events are suppressed inside the block. Observers get one
+        "bulk_mutated" event when the outermost block exits, carrying the net
+        change in vertex and edge counts. It fires on error too, since part
+        of the batch may already be applied. Blocks nest.
+
+        Yields:
+            None
+
+        Examples:
+            >>> with graph.bulk_mutation():
+            ...     for vertex_id in ("A", "B", "C"):
+            ...         graph.add_vertex(vertex_id)
+        """
+        previous = self._suppress_observers
+        if not previous:
+            vertices_before = self.vertex_count()
+            edges_before = self.edge_count()
+        self._suppress_observers = True
+        try:
+            yield
+        finally:
+            self._suppress_observers = previous
+            if not previous:
+                self._notify_observers(
+                    "bulk_mutated",
+                    self.vertex_count() - vertices_before,
+                    self.edge_count() - edges_before,
+                )
+
     def _notify_observers(self, event: str, *args: Any) -> None:
         """Notify all observers of a graph change."""
+        if self._suppress_observers or not self._observers:
+            return
         for observer in self._observers:
             if hasattr(observer, "update"):
                 observer.update(event, *args)
@@ -1,15 +1,19 @@
 """
-Edge model with Pydantic validation.
+Edge model.
 
 This module defines the Edge class which represents a connection between
-vertices in a graph with optional weight and arbitrary attributes.
+vertices in a graph with optional weight and arbitrary attributes. Edges
+are created in bulk by every graph operation, so the class is a slotted,
+frozen dataclass validated by hand in ``__post_init__`` rather than a
+Pydantic model.
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Generic, TypeVar
-
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+import math
+import sys
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast
 
 if TYPE_CHECKING:
     from packages.core.vertex import Vertex
@@ -17,21 +21,24 @@ if TYPE_CHECKING:
 # Generic type for vertex identifiers
 VertexId = TypeVar("VertexId", bound=str | int)
 
+# Names resolved as fields (rather than attributes) by Edge.__getitem__
+_FIELD_NAMES = frozenset({"source", "target", "weight", "directed", "attributes"})
+
 
-class Edge(BaseModel, Generic[VertexId]):
+@dataclass(frozen=True, slots=True, eq=False)
+class Edge(Generic[VertexId]):
     """
     Represents an edge (connection) between two vertices in a graph.
 
-    This class uses Pydantic v2 for automatic validation of edge data,
-    including weight validation and attribute type checking.
-
     Attributes:
         source: Source vertex identifier
         target: Target vertex identifier
         weight: Edge weight (default: 1.0)
         directed: Whether this edge is directed (default: False)
         attributes: Arbitrary key-value pairs for edge metadata
-        _hash_cache: Cached hash value for performance
+        _endpoints: Comparison key: (source, target) if directed,
+            frozenset of both endpoints if undirected
+        _hash_cache: Hash value, computed at construction
 
     Type Parameters:
         VertexId: Type of vertex identifier
@@ -46,52 +53,75 @@ class Edge(BaseModel, Generic[VertexId]):
         False
 
     Notes:
-        - Edges are immutable by default (frozen=True)
+        - Edges are immutable (frozen dataclass)
         - Hash considers direction for directed edges
         - Weight must be non-negative (validated)
     """
 
-    model_config = ConfigDict(
-        frozen=True,
-        validate_assignment=True,
-        arbitrary_types_allowed=True,
-    )
-
-    __slots__ = ("_hash_cache",)
-
-    source: VertexId = Field(..., description="Source vertex identifier")
-    target: VertexId = Field(..., description="Target vertex identifier")
-    weight: float = Field(default=1.0, ge=0.0, description="Edge weight (non-negative)")
-    directed: bool = Field(default=False, description="Whether edge is directed")
-    attributes: dict[str, Any] = Field(
-        default_factory=dict,
-        description="Arbitrary metadata for the edge",
+    source: VertexId
+    target: VertexId
+    weight: float = 1.0
+    directed: bool = False
+    attributes: dict[str, Any] = field(default_factory=dict)
+    _endpoints: tuple[Any, Any] | frozenset[Any] | None = field(
+        default=None, init=False, repr=False, compare=False
     )
+    _hash_cache: int = field(default=0, init=False, repr=False, compare=False)
 
-    @field_validator("weight")
-    @classmethod
-    def validate_weight(cls, v: float) -> float:
+    def __post_init__(self) -> None:
         """
-        Validate edge weight is non-negative.
+        Validate the fields, then build the endpoint key and hash.
 
-        Args:
-            v: Weight value to validate
-
-        Returns:
-            Validated weight
+        Integer weights are coerced to float, and 0/1 directed flags to
+        bool. String endpoints are interned so they share the vertex id
+        objects.
 
         Raises:
-            ValueError: If weight is negative or NaN
+            ValueError: If weight is negative, NaN or not a number, an
+                endpoint is not a str or int, or directed is not a bool
         """
-        import math
-
-        if math.isnan(v):
+        weight = self.weight
+        if type(weight) is not float:
+            try:
+                weight = float(weight)
+            except (TypeError, ValueError):
+                msg = f"Edge weight must be a number, got {weight!r}"
+                raise ValueError(msg) from None
+            object.__setattr__(self, "weight", weight)
+        if math.isnan(weight):
             msg = "Edge weight cannot be NaN"
             raise ValueError(msg)
-        if v < 0:
-            msg = f"Edge weight must be non-negative, got {v}"
+        if weight < 0:
+            msg = f"Edge weight must be non-negative, got {weight}"
+            raise ValueError(msg)
+        directed = self.directed
+        if type(directed) is not bool:
+            if directed not in (0, 1):
+                msg = f"Edge directed flag must be a bool, got {directed!r}"
+                raise ValueError(msg)
+            object.__setattr__(self, "directed", bool(directed))
+        source = self.source
+        if type(source) is not str and not isinstance(source, str | int):
+            msg = f"Edge source must be a str or int, got {type(source).__name__}"
             raise ValueError(msg)
-        return v
+        if type(source) is str and (interned := sys.intern(cast("str", source))) is not source:
+            object.__setattr__(self, "source", interned)
+        target = self.target
+        if type(target) is not str and not isinstance(target, str | int):
+            msg = f"Edge target must be a str or int, got {type(target).__name__}"
+            raise ValueError(msg)
+        if type(target) is str and (interned := sys.intern(cast("str", target))) is not target:
+            object.__setattr__(self, "target", interned)
+        endpoints = self._endpoint_key()
+        object.__setattr__(self, "_endpoints", endpoints)
+        # The undirected key is a frozenset, so its hash is symmetric
+        object.__setattr__(self, "_hash_cache", hash(endpoints))
+
+    def _endpoint_key(self) -> tuple[Any, Any] | frozenset[Any]:
+        """Build the key that __eq__ and __hash__ compare."""
+        if self.directed:
+            return (self.source, self.target)
+        return frozenset((self.source, self.target))
 
     def is_self_loop(self) -> bool:
         """Check if this edge is a self-loop (source == target)."""
@@ -117,7 +147,7 @@ class Edge(BaseModel, Generic[VertexId]):
         Prioritizes fields (source, target, weight, directed),
         then looks in attributes.
         """
-        if hasattr(self, key) and key in self.model_fields:
+        if key in _FIELD_NAMES:
             return getattr(self, key)
         if key in self.attributes:
             return self.attributes[key]
@@ -127,6 +157,10 @@ class Edge(BaseModel, Generic[VertexId]):
         """
         Create a reversed edge (target -> source).
 
+        The attributes dict is shared with this edge rather than copied;
+        edges are immutable, and the graph API never mutates attributes
+        in place.
+
         Returns:
             New Edge with source and target swapped
 
@@ -141,7 +175,7 @@ class Edge(BaseModel, Generic[VertexId]):
             target=self.source,
             weight=self.weight,
             directed=self.directed,
-            attributes=self.attributes.copy(),
+            attributes=self.attributes,
         )
 
     def __hash__(self) -> int:
@@ -151,18 +185,27 @@ class Edge(BaseModel, Generic[VertexId]):
         For undirected edges, hash is symmetric (A-B == B-A).
         For directed edges, hash considers direction (A->B != B->A).
 
+        Computed once at construction.
+
         Returns:
             Hash value of the edge
         """
-        if not hasattr(self, "_hash_cache"):
-            if self.directed:
-                hash_value = hash((self.source, self.target, True))
-            else:
-                # Symmetric hash for undirected edges
-                hash_value = hash(frozenset([self.source, self.target]))
-            object.__setattr__(self, "_hash_cache", hash_value)
         return self._hash_cache
 
+    def __getstate__(self) -> tuple[Any, Any, float, bool, dict[str, Any]]:
+        """Pickle only the fields; the endpoint key and hash are rebuilt on load."""
+        return (self.source, self.target, self.weight, self.directed, self.attributes)
+
+    def __setstate__(self, state: tuple[Any, Any, float, bool, dict[str, Any]]) -> None:
+        """Restore fields from a pickled state."""
+        for name, value in zip(
+            ("source", "target", "weight", "directed", "attributes"), state, strict=True
+        ):
+            object.__setattr__(self, name, value)
+        endpoints = self._endpoint_key()
+        object.__setattr__(self, "_endpoints", endpoints)
+        object.__setattr__(self, "_hash_cache", hash(endpoints))
+
     def __eq__(self, other: object) -> bool:
         """
         Equality based on source, target, and direction.
@@ -179,16 +222,9 @@ class Edge(BaseModel, Generic[VertexId]):
         if not isinstance(other, Edge):
             return NotImplemented
 
-        if self.directed != other.directed:
-            return False
-
-        if self.directed:
-            return self.source == other.source and self.target == other.target
-
-        # Undirected: check both orientations
-        return (self.source == other.source and self.target == other.target) or (
-            self.source == other.target and self.target == other.source
-        )
+        # A directed key (tuple) never equals an undirected key (frozenset),
+        # so one comparison also covers the direction check.
+        return self._endpoints == other._endpoints
 
     def __repr__(self) -> str:
         """Concise string representation."""
@@ -1,31 +1,31 @@
 """
-Vertex model with Pydantic validation.
+Vertex model.
 
 This module defines the Vertex class which represents a node in a graph
-with arbitrary attributes validated through Pydantic v2.
+with arbitrary attributes. Vertices are created for every node of every
+graph, so the class is a slotted, frozen dataclass validated by hand in
+``__post_init__`` rather than a Pydantic model.
 """
 
 from __future__ import annotations
 
+import sys
+from dataclasses import dataclass, field
 from typing import Any, Generic, TypeVar
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
-
 # Generic type for vertex identifier
 VertexId = TypeVar("VertexId", bound=str | int)
 
 
-class Vertex(BaseModel, Generic[VertexId]):
+@dataclass(frozen=True, slots=True, eq=False)
+class Vertex(Generic[VertexId]):
     """
     Represents a vertex (node) in a graph with validated attributes.
 
-    This class uses Pydantic v2 for automatic validation of vertex data,
-    ensuring data integrity and type safety.
-
     Attributes:
         id: Unique identifier for the vertex (immutable after creation)
         attributes: Arbitrary key-value pairs for vertex metadata
-        _hash_cache: Cached hash value for performance (slots optimization)
+        _hash_cache: Hash value, computed at construction
 
     Type Parameters:
         VertexId: Type of vertex identifier (str, int, or hashable type)
@@ -40,45 +40,40 @@ class Vertex(BaseModel, Generic[VertexId]):
         42
 
     Notes:
-        - Vertices are immutable by default (frozen=True in Pydantic v2)
+        - Vertices are immutable (frozen dataclass)
+        - String IDs are stripped of surrounding whitespace
         - Hash is based on id only for O(1) set/dict operations
         - Uses __slots__ for memory efficiency
     """
 
-    model_config = ConfigDict(
-        frozen=True,  # Immutable after creation
-        str_strip_whitespace=True,  # Strip whitespace from string fields
-        validate_assignment=True,  # Validate on attribute assignment
-        arbitrary_types_allowed=True,  # Allow custom types in attributes
-    )
-
-    __slots__ = ("_hash_cache",)
+    id: VertexId
+    attributes: dict[str, Any] = field(default_factory=dict)
+    _hash_cache: int = field(default=0, init=False, repr=False, compare=False)
 
-    id: VertexId = Field(..., description="Unique identifier for the vertex")
-    attributes: dict[str, Any] = Field(
-        default_factory=dict,
-        description="Arbitrary metadata for the vertex",
-    )
-
-    @field_validator("id")
-    @classmethod
-    def validate_id(cls, v: VertexId) -> VertexId:
+    def __post_init__(self) -> None:
         """
-        Validate vertex identifier.
+        Validate vertex identifier and precompute the hash.
 
-        Args:
-            v: Vertex ID to validate
-
-        Returns:
-            Validated vertex ID
+        String ids are interned, so every copy of an id read from a file or
+        built at runtime shares one object and compares by identity first.
 
         Raises:
-            ValueError: If ID is empty string or invalid
+            ValueError: If ID is an empty string or not a str or int
         """
-        if isinstance(v, str) and not v.strip():
-            msg = "Vertex ID cannot be empty string"
+        vertex_id = self.id
+        if not isinstance(vertex_id, str | int):
+            msg = f"Vertex ID must be a str or int, got {type(vertex_id).__name__}"
             raise ValueError(msg)
-        return v
+        if isinstance(vertex_id, str):
+            # strip() always returns an exact str, which sys.intern accepts
+            stripped = sys.intern(vertex_id.strip())
+            if not stripped:
+                msg = "Vertex ID cannot be empty string"
+                raise ValueError(msg)
+            if stripped is not vertex_id:
+                object.__setattr__(self, "id", stripped)
+                vertex_id = self.id
+        object.__setattr__(self, "_hash_cache", hash(vertex_id))
 
     def get_attribute(self, key: str, default: Any = None) -> Any:
         """
@@ -101,13 +96,11 @@ class Vertex(BaseModel, Generic[VertexId]):
         """
         Hash based on vertex ID only.
 
-        Cached for performance with repeated set/dict operations.
+        Computed once at construction, so set/dict operations never rehash.
 
         Returns:
             Hash value of vertex ID
         """
-        if not hasattr(self, "_hash_cache"):
-            object.__setattr__(self, "_hash_cache", hash(self.id))
         return self._hash_cache
 
     def __eq__(self, other: object) -> bool:
@@ -127,6 +120,16 @@ class Vertex(BaseModel, Generic[VertexId]):
             return NotImplemented
         return self.id == other.id
 
+    def __getstate__(self) -> tuple[Any, dict[str, Any]]:
+        """Pickle only the fields; the hash is process-specific and rebuilt on load."""
+        return (self.id, self.attributes)
+
+    def __setstate__(self, state: tuple[Any, dict[str, Any]]) -> None:
+        """Restore fields from a pickled state."""
+        object.__setattr__(self, "id", state[0])
+        object.__setattr__(self, "attributes", state[1])
+        object.__setattr__(self, "_hash_cache", hash(state[0]))
+
     def __lt__(self, other: Vertex[VertexId]) -> bool:
         """
         Less-than comparison for sorting.
@@ -3,11 +3,52 @@ Graph Factory for creating graph instances.
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Final
+
+from packages.graphs.hypergraph import Hypergraph
+from packages.graphs.multigraph import Multigraph
+from packages.graphs.pseudograph import Pseudograph
+from packages.graphs.simple_graph import SimpleGraph
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
     from packages.core.base_graph import BaseGraph
 
+
+def _create_hypergraph(directed: bool, representation: str, **kwargs: Any) -> Hypergraph:
+    """
+    Create an undirected hypergraph.
+
+    Hypergraphs have a single storage strategy, selected by either the
+    factory default "adjacency_list" or "hypergraph".
+
+    Raises:
+        ValueError: If directed is True or representation is anything else
+    """
+    if directed:
+        msg = "Hypergraphs are always undirected; directed=True is not supported"
+        raise ValueError(msg)
+    if representation not in ("adjacency_list", "hypergraph"):
+        msg = f"Hypergraphs do not support the {representation!r} representation"
+        raise ValueError(msg)
+    return Hypergraph(**kwargs)
+
+
+# graph_type -> constructor taking (directed, representation, **kwargs)
+_REGISTRY: Final[Mapping[str, Callable[..., BaseGraph]]] = MappingProxyType(
+    {
+        "simple": SimpleGraph,
+        "multi": Multigraph,
+        "pseudo": Pseudograph,
+        "hyper": _create_hypergraph,
+    },
+)
+
+_VALID_TYPES: Final[frozenset[str]] = frozenset(_REGISTRY)
+
+
 class GraphFactory:
     """
     Factory for creating graph instances based on type and configuration.
@@ -26,31 +67,19 @@ class GraphFactory:
         Args:
             graph_type: Type of graph ("simple", "multi", "pseudo", "hyper")
             directed: Whether the graph is directed
-            representation: Internal representation strategy
+            representation: Internal representation strategy (hypergraphs
+                accept only the default or "hypergraph")
             **kwargs: Additional arguments passed to graph constructor
 
         Returns:
             A new graph instance
 
         Raises:
-            ValueError: If graph_type is unknown
+            ValueError: If graph_type is unknown, or the direction or
+                representation is unsupported by that graph type
         """
-        from packages.graphs.simple_graph import SimpleGraph
-        from packages.graphs.multigraph import Multigraph
-        from packages.graphs.pseudograph import Pseudograph
-        from packages.graphs.hypergraph import Hypergraph
-
-        graph_type = graph_type.lower()
-
-        if graph_type == "simple":
-            return SimpleGraph(directed=directed, representation=representation, **kwargs)
-        elif graph_type == "multi":
-            return Multigraph(directed=directed, representation=representation, **kwargs)
-        elif graph_type == "pseudo":
-            return Pseudograph(directed=directed, representation=representation, **kwargs)
-        elif graph_type == "hyper":
-            # Hypergraphs might have different constructor signatures or limited representation support
-            # For now, we assume basic compatibility or ignore specific kwargs if needed
-            return Hypergraph(representation=representation, **kwargs)
-        else:
-            raise ValueError(f"Unknown graph type: {graph_type}")
\ No newline at end of file
+        key = graph_type.lower()
+        if key not in _VALID_TYPES:
+            msg = f"Unknown graph type: {graph_type} (expected one of {sorted(_VALID_TYPES)})"
+            raise ValueError(msg)
+        return _REGISTRY[key](directed=directed, representation=representation, **kwargs)
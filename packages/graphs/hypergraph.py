@@ -10,14 +10,21 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+
 from packages.core.base_graph import BaseGraph
 from packages.core.vertex import Vertex
-from packages.representations.base_representation import GraphRepresentation
+from packages.representations.base_representation import (
+    GraphRepresentation,
+    RepresentationKind,
+)
 from packages.utils.exceptions import GraphConstraintError, VertexNotFoundError
 from packages.utils.validators import validate_hyperedge_vertices
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterable, Iterator
+
+    from scipy import sparse
 
 
 class Hyperedge:
@@ -25,9 +32,10 @@ class Hyperedge:
     Represents a hyperedge connecting multiple vertices.
 
     Attributes:
-        vertices: Set of vertex identifiers in this hyperedge
+        vertices: Frozenset of vertex identifiers in this hyperedge
         weight: Hyperedge weight (default: 1.0)
         attributes: Arbitrary metadata
+        _hash_cache: Hash of the vertex set, computed at construction
 
     Examples:
         >>> he = Hyperedge({"A", "B", "C"}, weight=5.0)
@@ -41,25 +49,33 @@ class Hyperedge:
 
     def __init__(
         self,
-        vertices: set[Any],
+        vertices: Iterable[Any],
         *,
         weight: float = 1.0,
-        **attributes: Any,
+        attributes: dict[str, Any] | None = None,
+        **extra: Any,
     ) -> None:
         """
         Initialize hyperedge.
 
         Args:
-            vertices: Set of vertex identifiers (must have ≥2 vertices)
+            vertices: Vertex identifiers (must have ≥2 distinct vertices);
+                stored as a frozenset
             weight: Hyperedge weight
-            **attributes: Arbitrary metadata
+            attributes: Metadata dict, stored by reference without copying
+            **extra: Arbitrary metadata
 
         Raises:
             ValueError: If vertices set has less than 2 elements
+            TypeError: If attributes is not a mapping
         """
-        self.vertices = validate_hyperedge_vertices(vertices)
+        # frozenset() hands back an exact frozenset unchanged, so this is the
+        # only conversion on the add_hyperedge path
+        vertex_set = frozenset(vertices)
+        self.vertices = validate_hyperedge_vertices(vertex_set)
+        self._hash_cache = hash(vertex_set)
         self.weight = weight
-        self.attributes = attributes
+        self.attributes = BaseGraph._merge_attributes(attributes, extra)
 
     def size(self) -> int:
         """Get number of vertices in this hyperedge."""
@@ -82,9 +98,7 @@ class Hyperedge:
         raise KeyError(f"Key {key!r} not found in Hyperedge")
 
     def __hash__(self) -> int:
-        """Hash based on frozenset of vertices."""
-        if not hasattr(self, "_hash_cache"):
-            object.__setattr__(self, "_hash_cache", hash(frozenset(self.vertices)))
+        """Hash based on the vertex set, computed once at construction."""
         return self._hash_cache
 
     def __eq__(self, other: object) -> bool:
@@ -104,16 +118,39 @@ class HypergraphRepresentation(GraphRepresentation):
     Specialized representation for hypergraphs.
 
     Stores hyperedges as sets of vertices with arbitrary cardinality.
+
+    Attributes:
+        _vertices: vertex_id -> Vertex object
+        _hyperedges: hyperedge_id -> Hyperedge object
+        _incidence: vertex_id -> ids of hyperedges containing that vertex
+        _vertex_set_index: frozenset of vertex ids -> ids of hyperedges over
+            exactly that set, in insertion order
+        _edge_counter: Next hyperedge id to hand out
+        _sparse_incidence: Cached SciPy incidence matrix, dropped on mutation
+        _degrees: Cached degree_array() result, dropped on mutation
     """
 
-    __slots__ = ("_vertices", "_hyperedges", "_incidence", "_edge_counter")
+    __slots__ = (
+        "_vertices",
+        "_hyperedges",
+        "_incidence",
+        "_vertex_set_index",
+        "_edge_counter",
+        "_sparse_incidence",
+        "_degrees",
+    )
+
+    kind = RepresentationKind.HYPERGRAPH
 
     def __init__(self) -> None:
         """Initialize hypergraph representation."""
         self._vertices: dict[Any, Vertex] = {}
         self._hyperedges: dict[int, Hyperedge] = {}
         self._incidence: dict[Any, set[int]] = {}  # vertex -> hyperedge IDs
+        self._vertex_set_index: dict[frozenset[Any], list[int]] = {}
         self._edge_counter = 0
+        self._sparse_incidence: sparse.csr_array | None = None
+        self._degrees: np.ndarray | None = None
 
     def add_vertex(self, vertex: Vertex) -> None:
         """Add vertex to hypergraph."""
@@ -122,6 +159,8 @@ class HypergraphRepresentation(GraphRepresentation):
             raise ValueError(msg)
         self._vertices[vertex.id] = vertex
         self._incidence[vertex.id] = set()
+        self._sparse_incidence = None
+        self._degrees = None
 
     def add_hyperedge(self, hyperedge: Hyperedge) -> int:
         """
@@ -152,9 +191,134 @@ class HypergraphRepresentation(GraphRepresentation):
         # Update incidence
         for vid in hyperedge.vertices:
             self._incidence[vid].add(edge_id)
+        self._vertex_set_index.setdefault(hyperedge.vertices, []).append(edge_id)
+        self._sparse_incidence = None
+        self._degrees = None
 
         return edge_id
 
+    def bulk_load(self, vertices: Iterable[Vertex], edges: Iterable[Hyperedge]) -> None:
+        """
+        Add many vertices and then many hyperedges.
+
+        Every hyperedge is checked against the vertex table before any is
+        stored, so a missing vertex leaves the hyperedges untouched.
+
+        Args:
+            vertices: Vertex objects to add
+            edges: Hyperedge objects to add (all vertices must be present)
+
+        Raises:
+            ValueError: If a vertex already exists
+            KeyError: If a hyperedge references a missing vertex
+        """
+        add_vertex = self.add_vertex
+        for vertex in vertices:
+            add_vertex(vertex)
+
+        hyperedges = list(edges)
+        known = self._vertices.keys()
+        for hyperedge in hyperedges:
+            if not hyperedge.vertices <= known:
+                missing = next(vid for vid in hyperedge.vertices if vid not in known)
+                msg = f"Vertex {missing!r} not found"
+                raise KeyError(msg)
+
+        store = self._hyperedges
+        incidence = self._incidence
+        index = self._vertex_set_index
+        edge_id = self._edge_counter
+        for hyperedge in hyperedges:
+            store[edge_id] = hyperedge
+            for vid in hyperedge.vertices:
+                incidence[vid].add(edge_id)
+            index.setdefault(hyperedge.vertices, []).append(edge_id)
+            edge_id += 1
+        self._edge_counter = edge_id
+        self._sparse_incidence = None
+        self._degrees = None
+
+    def to_csr(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Export hyperedge membership in compressed sparse row form.
+
+        Row j lists the vertices of the j-th hyperedge in iteration order:
+        its vertex positions (in vertices() order) are
+        ``indices[indptr[j]:indptr[j + 1]]``.
+
+        Returns:
+            Tuple of (indptr, indices) int64 arrays
+        """
+        hyperedges = self._hyperedges.values()
+        position = {vertex_id: i for i, vertex_id in enumerate(self._vertices)}
+        sizes = np.fromiter(
+            (len(h.vertices) for h in hyperedges), dtype=np.int64, count=len(hyperedges)
+        )
+        indptr = np.zeros(len(sizes) + 1, dtype=np.int64)
+        np.cumsum(sizes, out=indptr[1:])
+        indices = np.fromiter(
+            (position[vid] for h in hyperedges for vid in h.vertices),
+            dtype=np.int64,
+            count=int(indptr[-1]),
+        )
+        return indptr, indices
+
+    def to_sparse_incidence(self) -> sparse.csr_array:
+        """
+        Get the hyperedge-by-vertex incidence matrix as a SciPy CSR array.
+
+        Entry (j, i) is 1 if the j-th hyperedge contains the i-th vertex (both
+        in iteration order). The matrix is cached until the next mutation;
+        its data, indices and indptr arrays are read-only.
+
+        Returns:
+            int8 csr_array of shape (hyperedge_count, vertex_count)
+        """
+        if self._sparse_incidence is None:
+            from scipy import sparse
+
+            indptr, indices = self.to_csr()
+            data = np.ones(len(indices), dtype=np.int8)
+            incidence = sparse.csr_array(
+                (data, indices, indptr), shape=(len(self._hyperedges), len(self._vertices))
+            )
+            for array in (incidence.data, incidence.indices, incidence.indptr):
+                array.flags.writeable = False
+            self._sparse_incidence = incidence
+        return self._sparse_incidence
+
+    def to_sparse_adjacency(self) -> sparse.csr_array:
+        """
+        Get vertex co-membership counts as a SciPy CSR array.
+
+        Entry (i, k) is the number of hyperedges containing both the i-th and
+        k-th vertex; the diagonal is zero. Computed as ``I.T @ I`` from the
+        cached incidence matrix.
+
+        Returns:
+            int32 csr_array of shape (vertex_count, vertex_count)
+        """
+        incidence = self.to_sparse_incidence().astype(np.int32)
+        adjacency = (incidence.T @ incidence).tocsr()
+        adjacency.setdiag(0)
+        adjacency.eliminate_zeros()
+        return adjacency
+
+    def to_sparse_overlap(self) -> sparse.csr_array:
+        """
+        Get pairwise hyperedge overlap sizes as a SciPy CSR array.
+
+        Entry (j, k) is the number of vertices shared by the j-th and k-th
+        hyperedge (iteration order); the diagonal holds each hyperedge's
+        size. Computed as ``I @ I.T`` from the cached incidence matrix, so
+        only overlapping pairs are stored.
+
+        Returns:
+            int32 csr_array of shape (hyperedge_count, hyperedge_count)
+        """
+        incidence = self.to_sparse_incidence().astype(np.int32)
+        return (incidence @ incidence.T).tocsr()
+
     def remove_vertex(self, vertex_id: Any) -> None:
         """Remove vertex and all incident hyperedges."""
         if vertex_id not in self._vertices:
@@ -169,6 +333,8 @@ class HypergraphRepresentation(GraphRepresentation):
         # Remove vertex
         del self._vertices[vertex_id]
         del self._incidence[vertex_id]
+        self._sparse_incidence = None
+        self._degrees = None
 
     def remove_hyperedge(self, edge_id: int) -> None:
         """Remove hyperedge by ID."""
@@ -181,9 +347,15 @@ class HypergraphRepresentation(GraphRepresentation):
         # Update incidence
         for vid in hyperedge.vertices:
             self._incidence[vid].discard(edge_id)
+        same_set = self._vertex_set_index[hyperedge.vertices]
+        same_set.remove(edge_id)
+        if not same_set:
+            del self._vertex_set_index[hyperedge.vertices]
 
         # Remove hyperedge
         del self._hyperedges[edge_id]
+        self._sparse_incidence = None
+        self._degrees = None
 
     def has_vertex(self, vertex_id: Any) -> bool:
         """Check if vertex exists."""
@@ -196,13 +368,77 @@ class HypergraphRepresentation(GraphRepresentation):
             raise KeyError(msg)
         return self._vertices[vertex_id]
 
+    def get_hyperedge_by_vertices(self, vertices: Iterable[Any]) -> Hyperedge:
+        """
+        Get the first hyperedge spanning exactly the given vertices.
+
+        Time Complexity: O(k) for k vertices
+
+        Args:
+            vertices: Vertex identifiers of the hyperedge
+
+        Returns:
+            Earliest added Hyperedge over that vertex set
+
+        Raises:
+            KeyError: If no hyperedge spans exactly these vertices
+        """
+        vertex_set = frozenset(vertices)
+        edge_ids = self._vertex_set_index.get(vertex_set)
+        if edge_ids is None:
+            msg = f"No hyperedge with vertices {set(vertex_set)!r}"
+            raise KeyError(msg)
+        return self._hyperedges[edge_ids[0]]
+
     def get_incident_hyperedges(self, vertex_id: Any) -> set[Hyperedge]:
         """Get all hyperedges incident to a vertex."""
-        if vertex_id not in self._vertices:
+        return set(self.iter_incident_hyperedges(vertex_id))
+
+    def iter_incident_hyperedges(self, vertex_id: Any) -> Iterator[Hyperedge]:
+        """
+        Iterate over hyperedges incident to a vertex without building a set.
+
+        Unlike get_incident_hyperedges, parallel hyperedges over the same
+        vertex set are yielded separately. The graph must not be mutated
+        while iterating.
+
+        Raises:
+            KeyError: If the vertex doesn't exist (raised on call, not on
+                first iteration)
+        """
+        incident = self._incidence.get(vertex_id)
+        if incident is None:
+            msg = f"Vertex {vertex_id!r} not found"
+            raise KeyError(msg)
+        hyperedges = self._hyperedges
+        return (hyperedges[eid] for eid in incident)
+
+    def degree(self, vertex_id: Any) -> int:
+        """Get the number of hyperedges containing a vertex. Time Complexity: O(1)"""
+        incident = self._incidence.get(vertex_id)
+        if incident is None:
             msg = f"Vertex {vertex_id!r} not found"
             raise KeyError(msg)
+        return len(incident)
+
+    def degree_array(self) -> np.ndarray:
+        """
+        Get every vertex degree at once, in vertices() order.
 
-        return {self._hyperedges[eid] for eid in self._incidence[vertex_id]}
+        The array is cached until the next mutation and is read-only.
+
+        Returns:
+            int64 array of length vertex_count
+        """
+        if self._degrees is None:
+            incidence = self._incidence
+            self._degrees = np.fromiter(
+                (len(incidence[vid]) for vid in self._vertices),
+                dtype=np.int64,
+                count=len(self._vertices),
+            )
+            self._degrees.flags.writeable = False
+        return self._degrees
 
     def vertices(self) -> Iterator[Vertex]:
         """Iterate over vertices."""
@@ -225,7 +461,10 @@ class HypergraphRepresentation(GraphRepresentation):
         self._vertices.clear()
         self._hyperedges.clear()
         self._incidence.clear()
+        self._vertex_set_index.clear()
         self._edge_counter = 0
+        self._sparse_incidence = None
+        self._degrees = None
 
     # Stub implementations for base class compatibility
     def add_edge(self, edge: Any) -> None:
@@ -239,8 +478,8 @@ class HypergraphRepresentation(GraphRepresentation):
         raise NotImplementedError(msg)
 
     def has_edge(self, source: Any, target: Any) -> bool:
-        """Not applicable for hypergraphs."""
-        return False
+        """Check if a hyperedge spans exactly {source, target}. Time Complexity: O(1)"""
+        return frozenset((source, target)) in self._vertex_set_index
 
     def get_neighbors(self, vertex_id: Any) -> set[Any]:
         """
@@ -316,26 +555,36 @@ class Hypergraph(BaseGraph[Any, Any]):
             raise ValueError(msg)
         return HypergraphRepresentation()
 
-    def add_vertex(self, vertex_id: Any, **attributes: Any) -> None:
+    def add_vertex(
+        self,
+        vertex_id: Any,
+        *,
+        attributes: dict[str, Any] | None = None,
+        **extra: Any,
+    ) -> None:
         """Add vertex to hypergraph."""
-        vertex = Vertex(id=vertex_id, attributes=attributes)
+        vertex = Vertex(id=vertex_id, attributes=self._merge_attributes(attributes, extra))
         self._representation.add_vertex(vertex)
         self._notify_observers("vertex_added", vertex_id)
 
     def add_hyperedge(
         self,
-        vertices: set[Any] | list[Any],
+        vertices: Iterable[Any],
         *,
         weight: float = 1.0,
-        **attributes: Any,
+        attributes: dict[str, Any] | None = None,
+        **extra: Any,
     ) -> None:
         """
         Add hyperedge connecting multiple vertices.
 
+        Each call notifies observers; wrap large loads in bulk_mutation().
+
         Args:
-            vertices: Set or list of vertex identifiers (≥2 vertices)
+            vertices: Set, frozenset or list of vertex identifiers (≥2 vertices)
             weight: Hyperedge weight
-            **attributes: Arbitrary metadata
+            attributes: Metadata dict, stored by reference without copying
+            **extra: Arbitrary metadata
 
         Raises:
             ValueError: If less than 2 vertices provided
@@ -348,15 +597,18 @@ class Hypergraph(BaseGraph[Any, Any]):
             >>> hyper.add_vertex("C")
             >>> hyper.add_hyperedge({"A", "B", "C"}, weight=5.0)
         """
-        vertex_set = set(vertices) if not isinstance(vertices, set) else vertices
-        hyperedge = Hyperedge(vertex_set, weight=weight, **attributes)
+        hyperedge = Hyperedge(
+            vertices,
+            weight=weight,
+            attributes=self._merge_attributes(attributes, extra),
+        )
 
         if not isinstance(self._representation, HypergraphRepresentation):
             msg = "Internal error: invalid representation type"
             raise TypeError(msg)
 
         self._representation.add_hyperedge(hyperedge)
-        self._notify_observers("hyperedge_added", vertex_set)
+        self._notify_observers("hyperedge_added", hyperedge.vertices)
 
     def add_edge(
         self,
@@ -364,7 +616,8 @@ class Hypergraph(BaseGraph[Any, Any]):
         target: Any,
         *,
         weight: float = 1.0,
-        **attributes: Any,
+        attributes: dict[str, Any] | None = None,
+        **extra: Any,
     ) -> None:
         """
         Add binary edge (2-vertex hyperedge) for compatibility.
@@ -375,9 +628,10 @@ class Hypergraph(BaseGraph[Any, Any]):
             source: First vertex
             target: Second vertex
             weight: Edge weight
-            **attributes: Metadata
+            attributes: Metadata dict, stored by reference without copying
+            **extra: Metadata
         """
-        self.add_hyperedge({source, target}, weight=weight, **attributes)
+        self.add_hyperedge((source, target), weight=weight, attributes=attributes, **extra)
 
     def remove_vertex(self, vertex_id: Any) -> None:
         """Remove vertex and all incident hyperedges."""
@@ -404,13 +658,7 @@ class Hypergraph(BaseGraph[Any, Any]):
         Returns:
             True if hyperedge containing exactly these 2 vertices exists
         """
-        if not isinstance(self._representation, HypergraphRepresentation):
-            return False
-
-        for hyperedge in self._representation.hyperedges():
-            if hyperedge.vertices == {source, target}:
-                return True
-        return False
+        return self._representation.has_edge(source, target)
 
     def get_neighbors(self, vertex_id: Any) -> set[Any]:
         """
@@ -457,6 +705,52 @@ class Hypergraph(BaseGraph[Any, Any]):
             return set()
         return self._representation.get_incident_hyperedges(vertex_id)
 
+    def iter_incident_hyperedges(self, vertex_id: Any) -> Iterator[Hyperedge]:
+        """
+        Lazily iterate over hyperedges incident to a vertex.
+
+        Prefer this over get_incident_hyperedges when the hyperedges are only
+        looped over; see HypergraphRepresentation.iter_incident_hyperedges.
+
+        Examples:
+            >>> hyper = Hypergraph.from_edge_list([("A", "B"), ("A", "C")])
+            >>> sum(h.weight for h in hyper.iter_incident_hyperedges("A"))
+            2.0
+        """
+        if not isinstance(self._representation, HypergraphRepresentation):
+            msg = "Internal error: invalid representation type"
+            raise TypeError(msg)
+        return self._representation.iter_incident_hyperedges(vertex_id)
+
+    def get_hyperedge_by_vertices(self, vertices: Iterable[Any]) -> Hyperedge:
+        """
+        Get the hyperedge spanning exactly the given vertices.
+
+        If several hyperedges share the vertex set, the earliest added one
+        is returned.
+
+        Args:
+            vertices: Vertex identifiers of the hyperedge
+
+        Returns:
+            Matching Hyperedge object
+
+        Raises:
+            KeyError: If no hyperedge spans exactly these vertices
+
+        Examples:
+            >>> hyper = Hypergraph()
+            >>> for vid in "ABC":
+            ...     hyper.add_vertex(vid)
+            >>> hyper.add_hyperedge({"A", "B", "C"}, weight=2.0)
+            >>> hyper.get_hyperedge_by_vertices(["C", "A", "B"]).weight
+            2.0
+        """
+        if not isinstance(self._representation, HypergraphRepresentation):
+            msg = "Internal error: invalid representation type"
+            raise TypeError(msg)
+        return self._representation.get_hyperedge_by_vertices(vertices)
+
     def get_hyperedges_containing(self, vertex_id: Any) -> set[Hyperedge]:
         """
         Get all hyperedges containing a vertex.
@@ -464,6 +758,101 @@ class Hypergraph(BaseGraph[Any, Any]):
         """
         return self.get_incident_hyperedges(vertex_id)
 
+    @classmethod
+    def from_edge_list(
+        cls,
+        edges: Iterable[Iterable[Any]],
+        *,
+        weights: Iterable[float] | None = None,
+        **kwargs: Any,
+    ) -> Hypergraph:
+        """
+        Build a hypergraph from vertex collections in one bulk load.
+
+        Vertices are created for every id that appears in an edge, in
+        first-seen order, and everything is added with a single bulk_load.
+
+        Args:
+            edges: One iterable of vertex ids per hyperedge
+            weights: Optional weights, one per hyperedge (default: 1.0 each)
+            **kwargs: Graph metadata passed to the constructor
+
+        Returns:
+            New Hypergraph
+
+        Raises:
+            ValueError: If a hyperedge has fewer than 2 distinct vertices,
+                or weights and edges differ in length
+
+        Examples:
+            >>> hyper = Hypergraph.from_edge_list([("A", "B"), ("B", "C", "D")])
+            >>> hyper.hyperedge_count()
+            2
+        """
+        vertex_lists = [list(vertex_ids) for vertex_ids in edges]
+        if weights is None:
+            hyperedges = [Hyperedge(vertex_ids) for vertex_ids in vertex_lists]
+        else:
+            hyperedges = [
+                Hyperedge(vertex_ids, weight=weight)
+                for vertex_ids, weight in zip(vertex_lists, weights, strict=True)
+            ]
+        vertex_ids = dict.fromkeys(vid for vertex_ids in vertex_lists for vid in vertex_ids)
+
+        graph = cls(**kwargs)
+        graph.bulk_load([Vertex(id=vid) for vid in vertex_ids], hyperedges)
+        return graph
+
+    def to_csr(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Export hyperedge membership as CSR (indptr, indices) arrays.
+
+        See HypergraphRepresentation.to_csr.
+
+        Returns:
+            Tuple of (indptr, indices) int64 arrays
+        """
+        if not isinstance(self._representation, HypergraphRepresentation):
+            msg = "Internal error: invalid representation type"
+            raise TypeError(msg)
+        return self._representation.to_csr()
+
+    def to_sparse_incidence(self) -> sparse.csr_array:
+        """
+        Get the (hyperedge x vertex) incidence matrix as a cached SciPy CSR array.
+
+        See HypergraphRepresentation.to_sparse_incidence.
+        """
+        if not isinstance(self._representation, HypergraphRepresentation):
+            msg = "Internal error: invalid representation type"
+            raise TypeError(msg)
+        return self._representation.to_sparse_incidence()
+
+    def to_sparse_adjacency(self) -> sparse.csr_array:
+        """
+        Get the (vertex x vertex) co-membership count matrix as a SciPy CSR array.
+
+        Useful for spectral or clustering workloads over the whole hypergraph;
+        see HypergraphRepresentation.to_sparse_adjacency.
+        """
+        if not isinstance(self._representation, HypergraphRepresentation):
+            msg = "Internal error: invalid representation type"
+            raise TypeError(msg)
+        return self._representation.to_sparse_adjacency()
+
+    def to_sparse_overlap(self) -> sparse.csr_array:
+        """
+        Get the (hyperedge x hyperedge) shared-vertex count matrix as a SciPy CSR array.
+
+        Answers "do these hyperedges share at least k vertices?" for every
+        pair at once, e.g. ``overlap >= k``; see
+        HypergraphRepresentation.to_sparse_overlap.
+        """
+        if not isinstance(self._representation, HypergraphRepresentation):
+            msg = "Internal error: invalid representation type"
+            raise TypeError(msg)
+        return self._representation.to_sparse_overlap()
+
     def hyperedge_count(self) -> int:
         """Get total number of hyperedges."""
         if isinstance(self._representation, HypergraphRepresentation):
@@ -478,9 +867,24 @@ class Hypergraph(BaseGraph[Any, Any]):
             vertex_id: Vertex identifier
 
         Returns:
-            Number of hyperedges incident to this vertex
+            Number of hyperedges incident to this vertex, counting parallel
+            hyperedges over the same vertex set separately
         """
-        return len(self.get_incident_hyperedges(vertex_id))
+        if not isinstance(self._representation, HypergraphRepresentation):
+            msg = "Internal error: invalid representation type"
+            raise TypeError(msg)
+        return self._representation.degree(vertex_id)
+
+    def degree_array(self) -> np.ndarray:
+        """
+        Get all vertex degrees as a cached int64 array in vertices() order.
+
+        See HypergraphRepresentation.degree_array.
+        """
+        if not isinstance(self._representation, HypergraphRepresentation):
+            msg = "Internal error: invalid representation type"
+            raise TypeError(msg)
+        return self._representation.degree_array()
 
     def to_bipartite_graph(self) -> SimpleGraph:
         """
@@ -506,17 +910,22 @@ class Hypergraph(BaseGraph[Any, Any]):
 
         bipartite = SimpleGraph(directed=False)
 
-        # Add vertex nodes
-        for vertex in self.vertices():
-            bipartite.add_vertex(f"v_{vertex.id}", **vertex.attributes)
+        add_vertex = bipartite.add_vertex
+        add_edge = bipartite.add_edge
 
-        # Add hyperedge nodes and connect them
-        for i, hyperedge in enumerate(self.edges()):
-            edge_id = f"e_{i}"
-            bipartite.add_vertex(edge_id, type="hyperedge", weight=hyperedge.weight)
+        with bipartite.bulk_mutation():
+            # Add vertex nodes
+            for vertex in self.vertices():
+                add_vertex(f"v_{vertex.id}", attributes=vertex.attributes)
 
-            # Connect to all incident vertices
-            for vid in hyperedge.vertices:
-                bipartite.add_edge(f"v_{vid}", edge_id, weight=hyperedge.weight)
+            # Add hyperedge nodes and connect them
+            for i, hyperedge in enumerate(self.edges()):
+                edge_id = f"e_{i}"
+                weight = hyperedge.weight
+                add_vertex(edge_id, type="hyperedge", weight=weight)
+
+                # Connect to all incident vertices
+                for vid in hyperedge.vertices:
+                    add_edge(f"v_{vid}", edge_id, weight=weight)
 
         return bipartite
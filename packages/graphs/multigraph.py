@@ -7,35 +7,78 @@ pair of vertices but prohibits self-loops.
 
 from __future__ import annotations
 
-from collections import defaultdict
+from collections import Counter
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+
 from packages.core.base_graph import BaseGraph
 from packages.core.edge import Edge
 from packages.core.vertex import Vertex
-from packages.representations.base_representation import GraphRepresentation
+from packages.representations.base_representation import (
+    GraphRepresentation,
+    RepresentationKind,
+)
+from packages.representations.csr import build_csr
 from packages.utils.exceptions import GraphConstraintError, VertexNotFoundError
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
+    from numpy.typing import DTypeLike
+    from scipy import sparse
+
 
 class MultigraphRepresentation(GraphRepresentation):
     """
     Specialized representation for multigraphs allowing parallel edges.
 
-    Stores edges as lists to allow multiple edges between same vertices.
+    Stores edges by id to allow multiple edges between same vertices.
+
+    Attributes:
+        _adj_list: vertex_id -> Counter of neighbor id -> number of edges, so
+            has_edge and edge_multiplicity are O(1). An undirected self-loop
+            is counted once.
+        _vertices: vertex_id -> Vertex object
+        _edges: edge_id -> Edge object
+        _incident: vertex_id -> ids of edges touching that vertex, so removing
+            a vertex visits only its own edges
+        _pair_index: (source, target) -> ids of edges between them in
+            insertion order; undirected edges are also listed under the
+            reversed pair, so get_edge and remove_edge are O(1) probes
+        _self_loops: vertex_id -> number of self-loops on it, holding only
+            vertices that have at least one
+        _csr: Cached (indptr, indices, data) arrays from to_csr(), dropped on
+            every mutation
+        _directed: Whether the graph is directed
+        _edge_counter: Next edge id to hand out
     """
 
-    __slots__ = ("_adj_list", "_vertices", "_edges", "_directed", "_edge_counter")
+    __slots__ = (
+        "_adj_list",
+        "_vertices",
+        "_edges",
+        "_incident",
+        "_pair_index",
+        "_self_loops",
+        "_directed",
+        "_edge_counter",
+        "_csr",
+    )
+
+    kind = RepresentationKind.MULTIGRAPH
 
     def __init__(self, *, directed: bool = False) -> None:
         """Initialize multigraph representation."""
-        self._adj_list: dict[Any, list[Any]] = defaultdict(list)
+        self._adj_list: dict[Any, Counter[Any]] = {}
         self._vertices: dict[Any, Vertex] = {}
         self._edges: dict[int, Edge] = {}  # edge_id -> Edge
+        self._incident: dict[Any, set[int]] = {}
+        self._pair_index: dict[tuple[Any, Any], list[int]] = {}
+        self._self_loops: dict[Any, int] = {}
         self._directed = directed
         self._edge_counter = 0
+        self._csr: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None
 
     def add_vertex(self, vertex: Vertex) -> None:
         """Add vertex to multigraph."""
@@ -43,7 +86,9 @@ class MultigraphRepresentation(GraphRepresentation):
             msg = f"Vertex {vertex.id!r} already exists"
             raise ValueError(msg)
         self._vertices[vertex.id] = vertex
-        self._adj_list[vertex.id]
+        self._adj_list[vertex.id] = Counter()
+        self._incident[vertex.id] = set()
+        self._csr = None
 
     def add_edge(self, edge: Edge) -> int:
         """
@@ -56,79 +101,178 @@ class MultigraphRepresentation(GraphRepresentation):
         """
         if edge.source not in self._vertices:
             msg = f"Source vertex {edge.source!r} not found"
-            raise KeyError(msg)
+            raise VertexNotFoundError(msg)
         if edge.target not in self._vertices:
             msg = f"Target vertex {edge.target!r} not found"
-            raise KeyError(msg)
+            raise VertexNotFoundError(msg)
 
         # Assign unique edge ID
         edge_id = self._edge_counter
         self._edge_counter += 1
 
-        # Add to adjacency list
-        self._adj_list[edge.source].append(edge.target)
-        if not self._directed:
-            self._adj_list[edge.target].append(edge.source)
+        # Add to adjacency counts
+        self._adj_list[edge.source][edge.target] += 1
+        if not self._directed and edge.source != edge.target:
+            self._adj_list[edge.target][edge.source] += 1
 
         # Store edge with ID
         self._edges[edge_id] = edge
+        self._incident[edge.source].add(edge_id)
+        self._incident[edge.target].add(edge_id)
+        for pair in self._pairs(edge):
+            self._pair_index.setdefault(pair, []).append(edge_id)
+        if edge.source == edge.target:
+            self._self_loops[edge.source] = self._self_loops.get(edge.source, 0) + 1
+        self._csr = None
 
         return edge_id
 
+    def _pairs(self, edge: Edge) -> tuple[tuple[Any, Any], ...]:
+        """Return the pair index keys an edge is listed under."""
+        if self._directed or edge.source == edge.target:
+            return ((edge.source, edge.target),)
+        return ((edge.source, edge.target), (edge.target, edge.source))
+
+    def _unindex(self, edge: Edge, edge_id: int) -> None:
+        """Drop an edge id from the pair index, removing emptied pairs."""
+        pair_index = self._pair_index
+        for pair in self._pairs(edge):
+            ids = pair_index[pair]
+            ids.remove(edge_id)
+            if not ids:
+                del pair_index[pair]
+
     def remove_vertex(self, vertex_id: Any) -> None:
-        """Remove vertex and all incident edges."""
+        """
+        Remove vertex and all incident edges.
+
+        Time Complexity: O(deg(v))
+        """
         if vertex_id not in self._vertices:
             msg = f"Vertex {vertex_id!r} not found"
             raise KeyError(msg)
 
-        # Remove all edges involving this vertex
-        edges_to_remove = [
-            eid for eid, e in self._edges.items() if e.source == vertex_id or e.target == vertex_id
-        ]
-        for eid in edges_to_remove:
-            del self._edges[eid]
-
-        # Remove from adjacency list
-        del self._adj_list[vertex_id]
-        for neighbors in self._adj_list.values():
-            while vertex_id in neighbors:
-                neighbors.remove(vertex_id)
+        # Remove only the edges touching this vertex, collecting the other ends
+        edges = self._edges
+        incident = self._incident
+        affected: set[Any] = set()
+        for eid in incident.pop(vertex_id):
+            edge = edges.pop(eid)
+            self._unindex(edge, eid)
+            other = edge.target if edge.source == vertex_id else edge.source
+            if other != vertex_id:
+                incident[other].discard(eid)
+                affected.add(other)
+
+        # Drop this vertex from each affected neighbor's counts
+        adj_list = self._adj_list
+        del adj_list[vertex_id]
+        for other in affected:
+            adj_list[other].pop(vertex_id, None)
 
         # Remove vertex
         del self._vertices[vertex_id]
+        self._self_loops.pop(vertex_id, None)
+        self._csr = None
 
     def remove_edge(self, source: Any, target: Any) -> None:
         """
         Remove one edge between source and target.
 
-        If multiple edges exist, removes the first one found.
+        If multiple edges exist, removes the earliest added one.
+
+        Time Complexity: O(multiplicity)
         """
-        # Find first matching edge
-        edge_id = None
-        for eid, edge in self._edges.items():
-            if edge.source == source and edge.target == target:
-                edge_id = eid
-                break
-
-        if edge_id is None:
+        ids = self._pair_index.get((source, target))
+        if ids is None:
             msg = f"Edge {source!r} -> {target!r} not found"
             raise KeyError(msg)
+        edge_id = ids[0]
+        edge = self._edges.pop(edge_id)
+        self._unindex(edge, edge_id)
+
+        # Remove from adjacency counts
+        self._decrement(edge.source, edge.target)
+        if not self._directed and edge.source != edge.target:
+            self._decrement(edge.target, edge.source)
+
+        self._incident[edge.source].discard(edge_id)
+        self._incident[edge.target].discard(edge_id)
+        if edge.source == edge.target:
+            remaining = self._self_loops[edge.source] - 1
+            if remaining:
+                self._self_loops[edge.source] = remaining
+            else:
+                del self._self_loops[edge.source]
+        self._csr = None
+
+    def remove_self_loops(self) -> dict[Any, int]:
+        """
+        Remove every self-loop at once.
 
-        # Remove from adjacency list
-        self._adj_list[source].remove(target)
-        if not self._directed:
-            self._adj_list[target].remove(source)
+        Jumps straight to the (v, v) pair index entries of vertices that have
+        loops, so ordinary edges are never visited.
 
-        # Remove edge
-        del self._edges[edge_id]
+        Time Complexity: O(number of self-loops)
+
+        Returns:
+            Dictionary mapping vertex_id -> number of loops removed
+        """
+        removed = self._self_loops
+        edges = self._edges
+        for vertex_id in removed:
+            incident = self._incident[vertex_id]
+            for edge_id in self._pair_index.pop((vertex_id, vertex_id)):
+                del edges[edge_id]
+                incident.discard(edge_id)
+            del self._adj_list[vertex_id][vertex_id]
+        self._self_loops = {}
+        if removed:
+            self._csr = None
+        return removed
+
+    def _decrement(self, source: Any, target: Any) -> None:
+        """Drop one source -> target adjacency count, removing it at zero."""
+        neighbors = self._adj_list[source]
+        remaining = neighbors[target] - 1
+        if remaining:
+            neighbors[target] = remaining
+        else:
+            del neighbors[target]
 
     def has_vertex(self, vertex_id: Any) -> bool:
         """Check if vertex exists."""
         return vertex_id in self._vertices
 
     def has_edge(self, source: Any, target: Any) -> bool:
-        """Check if at least one edge exists between source and target."""
-        return target in self._adj_list.get(source, [])
+        """Check if at least one edge exists between source and target. Time Complexity: O(1)"""
+        neighbors = self._adj_list.get(source)
+        return neighbors is not None and target in neighbors
+
+    def edge_multiplicity(self, source: Any, target: Any) -> int:
+        """
+        Count edges between source and target. Time Complexity: O(1)
+
+        For undirected graphs, edges in either orientation are counted.
+        """
+        neighbors = self._adj_list.get(source)
+        return 0 if neighbors is None else neighbors[target]
+
+    def self_loop_count(self, vertex_id: Any) -> int:
+        """Count self-loops on a vertex (0 if it has none or is unknown). Time Complexity: O(1)"""
+        return self._self_loops.get(vertex_id, 0)
+
+    def count_self_loops(self) -> int:
+        """Count all self-loops. Time Complexity: O(vertices with loops)"""
+        return sum(self._self_loops.values())
+
+    def self_loop_counts(self) -> dict[Any, int]:
+        """Get a copy of the vertex_id -> self-loop count map, omitting loop-free vertices."""
+        return dict(self._self_loops)
+
+    def neighbor_counts(self) -> dict[Any, int]:
+        """Get vertex_id -> number of unique neighbors for every vertex in one pass."""
+        return {vertex_id: len(neighbors) for vertex_id, neighbors in self._adj_list.items()}
 
     def get_neighbors(self, vertex_id: Any) -> set[Any]:
         """Get unique neighbors (may have multiple edges to same neighbor)."""
@@ -145,12 +289,17 @@ class MultigraphRepresentation(GraphRepresentation):
         return self._vertices[vertex_id]
 
     def get_edge(self, source: Any, target: Any) -> Edge:
-        """Get first edge between source and target."""
-        for edge in self._edges.values():
-            if edge.source == source and edge.target == target:
-                return edge
-        msg = f"Edge {source!r} -> {target!r} not found"
-        raise KeyError(msg)
+        """Get first edge between source and target. Time Complexity: O(1)"""
+        ids = self._pair_index.get((source, target))
+        if ids is None:
+            msg = f"Edge {source!r} -> {target!r} not found"
+            raise KeyError(msg)
+        return self._edges[ids[0]]
+
+    def get_edges_between(self, source: Any, target: Any) -> list[Edge]:
+        """Get all edges between source and target in insertion order."""
+        edges = self._edges
+        return [edges[eid] for eid in self._pair_index.get((source, target), ())]
 
     def vertices(self) -> Iterator[Vertex]:
         """Iterate over vertices."""
@@ -173,7 +322,61 @@ class MultigraphRepresentation(GraphRepresentation):
         self._adj_list.clear()
         self._vertices.clear()
         self._edges.clear()
+        self._incident.clear()
+        self._pair_index.clear()
+        self._self_loops.clear()
         self._edge_counter = 0
+        self._csr = None
+
+    def to_csr(self, dtype: DTypeLike = np.float64) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Export the adjacency structure in compressed sparse row form.
+
+        Row i holds the out-edges of the i-th vertex (in vertices() order):
+        neighbor positions are ``indices[indptr[i]:indptr[i + 1]]`` and edge
+        weights the matching slice of ``data``. Parallel edges stay separate
+        entries. Undirected edges appear in both endpoint rows, except
+        self-loops, which appear once. The arrays are cached until the next
+        mutation and are read-only.
+
+        Args:
+            dtype: Weight dtype. float32 halves the memory traffic of the data
+                array at the cost of ~7 significant digits; other dtypes are
+                converted from the cached float64 weights on each call.
+
+        Returns:
+            Tuple of (indptr, indices) int64 arrays and the data array
+        """
+        if self._csr is None:
+            position = {vertex_id: i for i, vertex_id in enumerate(self._vertices)}
+            edges = self._edges.values()
+            count = len(edges)
+            src = np.fromiter((position[e.source] for e in edges), dtype=np.int64, count=count)
+            tgt = np.fromiter((position[e.target] for e in edges), dtype=np.int64, count=count)
+            weights = np.fromiter((e.weight for e in edges), dtype=np.float64, count=count)
+            self._csr = build_csr(len(position), src, tgt, weights, directed=self._directed)
+        indptr, indices, data = self._csr
+        return indptr, indices, data.astype(dtype, copy=False)
+
+    def to_sparse_adjacency(self, dtype: DTypeLike = np.float32) -> sparse.csr_array:
+        """
+        Get the weighted adjacency matrix as a SciPy CSR array.
+
+        Entry (i, k) is the summed weight of all parallel edges from the i-th
+        to the k-th vertex. Weights default to float32 for large sparse
+        linear algebra; pass ``dtype=np.float64`` when full precision matters.
+
+        Returns:
+            csr_array of shape (vertex_count, vertex_count)
+        """
+        from scipy import sparse
+
+        indptr, indices, data = self.to_csr(dtype)
+        size = len(self._vertices)
+        # sum_duplicates() works in place, so the read-only cache is copied
+        adjacency = sparse.csr_array((data, indices, indptr), shape=(size, size), copy=True)
+        adjacency.sum_duplicates()
+        return adjacency
 
 
 class Multigraph(BaseGraph[Any, Any]):
@@ -192,15 +395,29 @@ class Multigraph(BaseGraph[Any, Any]):
     """
 
     def _create_representation(self, repr_type: str) -> GraphRepresentation:
-        """Create multigraph representation."""
-        if repr_type != "adjacency_list":
-            msg = "Multigraph currently only supports adjacency_list representation"
+        """
+        Create multigraph representation.
+
+        "adjacency_list" (the default) and "multigraph" both select the
+        dedicated multigraph storage.
+        """
+        if repr_type not in ("adjacency_list", RepresentationKind.MULTIGRAPH):
+            msg = (
+                f"Unsupported representation: {repr_type!r}. "
+                f"{type(self).__name__} supports: adjacency_list, multigraph"
+            )
             raise ValueError(msg)
         return MultigraphRepresentation(directed=self._directed)
 
-    def add_vertex(self, vertex_id: Any, **attributes: Any) -> None:
+    def add_vertex(
+        self,
+        vertex_id: Any,
+        *,
+        attributes: dict[str, Any] | None = None,
+        **extra: Any,
+    ) -> None:
         """Add vertex to multigraph."""
-        vertex = Vertex(id=vertex_id, attributes=attributes)
+        vertex = Vertex(id=vertex_id, attributes=self._merge_attributes(attributes, extra))
         self._representation.add_vertex(vertex)
         self._notify_observers("vertex_added", vertex_id)
 
@@ -210,7 +427,8 @@ class Multigraph(BaseGraph[Any, Any]):
         target: Any,
         *,
         weight: float = 1.0,
-        **attributes: Any,
+        attributes: dict[str, Any] | None = None,
+        **extra: Any,
     ) -> None:
         """
         Add edge to multigraph.
@@ -228,11 +446,22 @@ class Multigraph(BaseGraph[Any, Any]):
             target=target,
             weight=weight,
             directed=self._directed,
-            attributes=attributes,
+            attributes=self._merge_attributes(attributes, extra),
         )
         self._representation.add_edge(edge)
         self._notify_observers("edge_added", source, target)
 
+    def _check_edge_constraints(self, edge: Edge) -> None:
+        """
+        Reject self-loops.
+
+        Raises:
+            GraphConstraintError: If the edge is a self-loop
+        """
+        if edge.source == edge.target:
+            msg = f"Multigraphs cannot contain self-loops: {edge.source!r}"
+            raise GraphConstraintError(msg)
+
     def remove_vertex(self, vertex_id: Any) -> None:
         """Remove vertex from multigraph."""
         self._representation.remove_vertex(vertex_id)
@@ -263,14 +492,6 @@ class Multigraph(BaseGraph[Any, Any]):
         """Get neighbors (unique, even if multiple edges exist)."""
         return self._representation.get_neighbors(vertex_id)
 
-    def vertex_count(self) -> int:
-        """Get total number of vertices."""
-        return self._representation.vertex_count()
-
-    def edge_count(self) -> int:
-        """Get total number of edges (including parallel edges)."""
-        return self._representation.edge_count()
-
     def vertices(self) -> Iterator[Vertex]:
         """Iterate over vertices."""
         yield from self._representation.vertices()
@@ -283,14 +504,44 @@ class Multigraph(BaseGraph[Any, Any]):
         """
         Get number of edges between two vertices.
 
+        For undirected graphs, edges in either orientation are counted.
+
         Returns:
             Number of parallel edges
         """
-        count = 0
-        for edge in self.edges():
-            if edge.source == source and edge.target == target:
-                count += 1
-        return count
+        if not isinstance(self._representation, MultigraphRepresentation):
+            msg = "Internal error: invalid representation type"
+            raise TypeError(msg)
+        return self._representation.edge_multiplicity(source, target)
+
+    def to_csr(self, dtype: DTypeLike = np.float64) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Export adjacency as cached CSR (indptr, indices, data) arrays.
+
+        See MultigraphRepresentation.to_csr.
+
+        Args:
+            dtype: Weight dtype of the data array
+
+        Returns:
+            Tuple of (indptr, indices) int64 arrays and the data array
+        """
+        if not isinstance(self._representation, MultigraphRepresentation):
+            msg = "Internal error: invalid representation type"
+            raise TypeError(msg)
+        return self._representation.to_csr(dtype)
+
+    def to_sparse_adjacency(self, dtype: DTypeLike = np.float32) -> sparse.csr_array:
+        """
+        Get the weighted (vertex x vertex) adjacency matrix as a SciPy CSR array.
+
+        Parallel edge weights are summed; see
+        MultigraphRepresentation.to_sparse_adjacency.
+        """
+        if not isinstance(self._representation, MultigraphRepresentation):
+            msg = "Internal error: invalid representation type"
+            raise TypeError(msg)
+        return self._representation.to_sparse_adjacency(dtype)
 
     def get_edges_between(self, source: Any, target: Any) -> list[Edge]:
         """
@@ -303,10 +554,7 @@ class Multigraph(BaseGraph[Any, Any]):
         Returns:
             List of Edge objects connecting the vertices
         """
-        edges = []
-        for edge in self.edges():
-            if edge.source == source and edge.target == target:
-                edges.append(edge)
-            elif not self._directed and edge.source == target and edge.target == source:
-                edges.append(edge)
-        return edges
+        if not isinstance(self._representation, MultigraphRepresentation):
+            msg = "Internal error: invalid representation type"
+            raise TypeError(msg)
+        return self._representation.get_edges_between(source, target)
@@ -51,7 +51,8 @@ class Pseudograph(Multigraph):
         target: Any,
         *,
         weight: float = 1.0,
-        **attributes: Any,
+        attributes: dict[str, Any] | None = None,
+        **extra: Any,
     ) -> None:
         """
         Add edge to pseudograph.
@@ -63,7 +64,8 @@ class Pseudograph(Multigraph):
             source: Source vertex identifier
             target: Target vertex identifier
             weight: Edge weight (default: 1.0)
-            **attributes: Arbitrary edge metadata
+            attributes: Metadata dict, stored by reference without copying
+            **extra: Arbitrary edge metadata
 
         Raises:
             VertexNotFoundError: If source or target doesn't exist
@@ -80,11 +82,14 @@ class Pseudograph(Multigraph):
             target=target,
             weight=weight,
             directed=self._directed,
-            attributes=attributes,
+            attributes=self._merge_attributes(attributes, extra),
         )
         self._representation.add_edge(edge)
         self._notify_observers("edge_added", source, target)
 
+    def _check_edge_constraints(self, edge: Edge) -> None:
+        """Accept every edge; self-loops are allowed in pseudographs."""
+
     def has_self_loop(self, vertex_id: Any) -> bool:
         """
         Check if vertex has any self-loops.
@@ -104,10 +109,7 @@ class Pseudograph(Multigraph):
             >>> pseudo.has_self_loop("A")
             True
         """
-        for edge in self.edges():
-            if edge.source == vertex_id and edge.target == vertex_id:
-                return True
-        return False
+        return self._loops().self_loop_count(vertex_id) > 0
 
     def self_loop_count(self, vertex_id: Any) -> int:
         """
@@ -127,19 +129,11 @@ class Pseudograph(Multigraph):
             >>> pseudo.self_loop_count("A")
             2
         """
-        count = 0
-        for edge in self.edges():
-            if edge.source == vertex_id and edge.target == vertex_id:
-                count += 1
-        return count
+        return self._loops().self_loop_count(vertex_id)
 
     def count_self_loops(self) -> int:
         """Count total number of self-loops in the graph."""
-        count = 0
-        for edge in self.edges():
-            if edge.source == edge.target:
-                count += 1
-        return count
+        return self._loops().count_self_loops()
 
     def total_degree(self, vertex_id: Any) -> int:
         """
@@ -151,7 +145,7 @@ class Pseudograph(Multigraph):
             vertex_id: Vertex to calculate degree for
 
         Returns:
-            Total degree (neighbors + 2×self-loops)
+            Total degree (other neighbors + 2×self-loops)
 
         Examples:
             >>> pseudo = Pseudograph()
@@ -162,14 +156,64 @@ class Pseudograph(Multigraph):
             >>> pseudo.total_degree("A")  # 1 (neighbor B) + 2 (self-loop) = 3
             3
         """
-        degree = len(self.get_neighbors(vertex_id))
+        neighbors = self.get_neighbors(vertex_id)
         self_loops = self.self_loop_count(vertex_id)
-        return degree + (2 * self_loops)
+        if self_loops:
+            # The vertex lists itself as a neighbor; count its loops only once
+            return len(neighbors) - 1 + 2 * self_loops
+        return len(neighbors)
+
+    def self_loop_counts_all(self) -> dict[Any, int]:
+        """
+        Get self-loop counts for every vertex that has at least one.
+
+        Read from the maintained per-vertex counter, so no edges are visited.
+
+        Returns:
+            Dictionary mapping vertex_id -> number of self-loops
+
+        Examples:
+            >>> pseudo = Pseudograph()
+            >>> pseudo.add_vertex("A")
+            >>> pseudo.add_vertex("B")
+            >>> pseudo.add_edge("A", "A")
+            >>> pseudo.self_loop_counts_all()
+            {'A': 1}
+        """
+        return self._loops().self_loop_counts()
+
+    def total_degrees_all(self) -> dict[Any, int]:
+        """
+        Get total_degree() for every vertex in a single pass.
+
+        Prefer this over calling total_degree per vertex, which builds a
+        neighbor set each time.
+
+        Returns:
+            Dictionary mapping vertex_id -> total degree
+
+        Examples:
+            >>> pseudo = Pseudograph()
+            >>> pseudo.add_vertex("A")
+            >>> pseudo.add_vertex("B")
+            >>> pseudo.add_edge("A", "B")
+            >>> pseudo.add_edge("A", "A")
+            >>> pseudo.total_degrees_all()
+            {'A': 3, 'B': 1}
+        """
+        representation = self._loops()
+        degrees = representation.neighbor_counts()
+        for vertex_id, self_loops in representation.self_loop_counts().items():
+            degrees[vertex_id] += self_loops * 2 - 1
+        return degrees
 
     def remove_all_self_loops(self) -> int:
         """
         Remove all self-loops from the graph.
 
+        Observers get a single "bulk_mutated" event rather than one
+        "edge_removed" event per loop.
+
         Returns:
             Number of self-loops removed
 
@@ -184,23 +228,16 @@ class Pseudograph(Multigraph):
             >>> pseudo.has_self_loop("A")
             False
         """
-        removed_count = 0
-        
-        # Collect self-loops to remove
-        self_loops = []
-        for edge in self.edges():
-            if edge.is_self_loop():
-                self_loops.append((edge.source, edge.target))
-        
-        # Remove them
-        for source, target in self_loops:
-            try:
-                self.remove_edge(source, target)
-                removed_count += 1
-            except KeyError:
-                pass  # Already removed
-        
-        return removed_count
+        with self.bulk_mutation():
+            removed = self._loops().remove_self_loops()
+        return sum(removed.values())
+
+    def _loops(self) -> MultigraphRepresentation:
+        """Return the representation, which tracks self-loops per vertex."""
+        if not isinstance(self._representation, MultigraphRepresentation):
+            msg = "Internal error: invalid representation type"
+            raise TypeError(msg)
+        return self._representation
 
 
 def example_pseudograph_usage() -> None:
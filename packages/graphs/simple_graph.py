@@ -11,7 +11,7 @@ Mathematical definition: G = (V, E) where E ⊆ V × V and no (v, v) ∈ E
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Final
 
 from packages.core.base_graph import BaseGraph
 from packages.core.edge import Edge
@@ -19,10 +19,19 @@ from packages.core.vertex import Vertex
 from packages.representations.adjacency_list import AdjacencyListRepresentation
 from packages.representations.adjacency_matrix import AdjacencyMatrixRepresentation
 from packages.representations.base_representation import GraphRepresentation
+from packages.representations.csr import CSRSnapshot
+from packages.representations.edge_list import EdgeListRepresentation
 from packages.utils.exceptions import GraphConstraintError, VertexNotFoundError
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable, Iterator
+
+# Representation strategies a SimpleGraph can be backed by, built once at import
+_REPRESENTATIONS: Final[dict[str, Callable[..., GraphRepresentation]]] = {
+    "adjacency_list": AdjacencyListRepresentation,
+    "adjacency_matrix": AdjacencyMatrixRepresentation,
+    "edge_list": EdgeListRepresentation,
+}
 
 
 class SimpleGraph(BaseGraph[Any, Any]):
@@ -97,22 +106,21 @@ class SimpleGraph(BaseGraph[Any, Any]):
         Raises:
             ValueError: If representation type is not supported
         """
-        from packages.representations.edge_list import EdgeListRepresentation
-        
-        repr_map = {
-            "adjacency_list": AdjacencyListRepresentation,
-            "adjacency_matrix": AdjacencyMatrixRepresentation,
-            "edge_list": EdgeListRepresentation,
-        }
-
-        if repr_type not in repr_map:
-            supported = ", ".join(repr_map.keys())
+        representation_class = _REPRESENTATIONS.get(repr_type)
+        if representation_class is None:
+            supported = ", ".join(_REPRESENTATIONS)
             msg = f"Unsupported representation: {repr_type!r}. Supported: {supported}"
             raise ValueError(msg)
 
-        return repr_map[repr_type](directed=self._directed)
+        return representation_class(directed=self._directed)
 
-    def add_vertex(self, vertex_id: Any, **attributes: Any) -> None:
+    def add_vertex(
+        self,
+        vertex_id: Any,
+        *,
+        attributes: dict[str, Any] | None = None,
+        **extra: Any,
+    ) -> None:
         """
         Add a vertex to the graph.
 
@@ -122,7 +130,8 @@ class SimpleGraph(BaseGraph[Any, Any]):
 
         Args:
             vertex_id: Unique identifier for the vertex
-            **attributes: Arbitrary key-value pairs for vertex metadata
+            attributes: Metadata dict, stored by reference without copying
+            **extra: Arbitrary key-value pairs for vertex metadata
 
         Raises:
             ValueError: If vertex already exists
@@ -133,7 +142,7 @@ class SimpleGraph(BaseGraph[Any, Any]):
             >>> graph.add_vertex("B", color="blue")
             >>> graph.add_vertex("A")  # Raises ValueError
         """
-        vertex = Vertex(id=vertex_id, attributes=attributes)
+        vertex = Vertex(id=vertex_id, attributes=self._merge_attributes(attributes, extra))
         self._representation.add_vertex(vertex)
         self._notify_observers("vertex_added", vertex_id)
 
@@ -143,7 +152,8 @@ class SimpleGraph(BaseGraph[Any, Any]):
         target: Any,
         *,
         weight: float = 1.0,
-        **attributes: Any,
+        attributes: dict[str, Any] | None = None,
+        **extra: Any,
     ) -> None:
         """
         Add an edge to the graph.
@@ -160,7 +170,8 @@ class SimpleGraph(BaseGraph[Any, Any]):
             source: Source vertex identifier
             target: Target vertex identifier
             weight: Edge weight (default: 1.0)
-            **attributes: Arbitrary key-value pairs for edge metadata
+            attributes: Metadata dict, stored by reference without copying
+            **extra: Arbitrary key-value pairs for edge metadata
 
         Raises:
             GraphConstraintError: If attempting to add self-loop
@@ -180,25 +191,29 @@ class SimpleGraph(BaseGraph[Any, Any]):
             msg = f"Simple graphs cannot contain self-loops: {source!r} -> {source!r}"
             raise GraphConstraintError(msg)
 
-        # Check vertices exist
-        if not self._representation.has_vertex(source):
-            msg = f"Source vertex {source!r} not found"
-            raise VertexNotFoundError(msg)
-        if not self._representation.has_vertex(target):
-            msg = f"Target vertex {target!r} not found"
-            raise VertexNotFoundError(msg)
-
-        # Create and add edge
+        # The representation checks both endpoints exist and raises
+        # VertexNotFoundError, so no separate has_vertex probes are needed
         edge = Edge(
             source=source,
             target=target,
             weight=weight,
             directed=self._directed,
-            attributes=attributes,
+            attributes=self._merge_attributes(attributes, extra),
         )
         self._representation.add_edge(edge)
         self._notify_observers("edge_added", source, target)
 
+    def _check_edge_constraints(self, edge: Edge) -> None:
+        """
+        Reject self-loops.
+
+        Raises:
+            GraphConstraintError: If the edge is a self-loop
+        """
+        if edge.source == edge.target:
+            msg = f"Simple graphs cannot contain self-loops: {edge.source!r} -> {edge.source!r}"
+            raise GraphConstraintError(msg)
+
     def remove_vertex(self, vertex_id: Any) -> None:
         """
         Remove a vertex and all its incident edges.
@@ -333,14 +348,6 @@ class SimpleGraph(BaseGraph[Any, Any]):
 
         return self._representation.get_neighbors(vertex_id)
 
-    def vertex_count(self) -> int:
-        """Get total number of vertices."""
-        return self._representation.vertex_count()
-
-    def edge_count(self) -> int:
-        """Get total number of edges."""
-        return self._representation.edge_count()
-
     def vertices(self) -> Iterator[Vertex]:
         """
         Iterate over all vertices in the graph.
@@ -375,6 +382,27 @@ class SimpleGraph(BaseGraph[Any, Any]):
         """
         yield from self._representation.edges()
 
+    def freeze(self) -> CSRSnapshot:
+        """
+        Take an immutable CSR snapshot for read-heavy workloads.
+
+        Neighbor and degree queries on the snapshot return array views
+        instead of building a set per call. The snapshot does not see later
+        mutations; take a new one after changing the graph.
+
+        Returns:
+            CSRSnapshot of the current vertices and edges
+
+        Examples:
+            >>> graph = SimpleGraph()
+            >>> graph.add_vertex("A")
+            >>> graph.add_vertex("B")
+            >>> graph.add_edge("A", "B")
+            >>> graph.freeze().degrees().tolist()
+            [1, 1]
+        """
+        return CSRSnapshot.from_graph(self)
+
     def to_multigraph(self) -> Multigraph:
         """
         Convert to multigraph (allows multiple edges).
@@ -391,10 +419,8 @@ class SimpleGraph(BaseGraph[Any, Any]):
         from packages.graphs.multigraph import Multigraph
 
         multi = Multigraph(directed=self._directed)
-        for vertex in self.vertices():
-            multi.add_vertex(vertex.id, **vertex.attributes)
-        for edge in self.edges():
-            multi.add_edge(edge.source, edge.target, weight=edge.weight, **edge.attributes)
+        # Vertex and Edge objects are immutable, so the copy shares them
+        multi.bulk_load(self.vertices(), self.edges())
         return multi
 
     def to_pseudograph(self) -> Pseudograph:
@@ -413,10 +439,8 @@ class SimpleGraph(BaseGraph[Any, Any]):
         from packages.graphs.pseudograph import Pseudograph
 
         pseudo = Pseudograph(directed=self._directed)
-        for vertex in self.vertices():
-            pseudo.add_vertex(vertex.id, **vertex.attributes)
-        for edge in self.edges():
-            pseudo.add_edge(edge.source, edge.target, weight=edge.weight, **edge.attributes)
+        # Vertex and Edge objects are immutable, so the copy shares them
+        pseudo.bulk_load(self.vertices(), self.edges())
         return pseudo
 
     def get_vertex(self, vertex_id: Any) -> Vertex:
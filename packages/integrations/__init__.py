@@ -1,5 +1,9 @@
 """Integration adapters for external libraries."""
 
+from __future__ import annotations
+
+from typing import Any
+
 from packages.integrations.networkx_adapter import (
     NETWORKX_AVAILABLE,
     NetworkXAdapter,
@@ -7,18 +11,26 @@ from packages.integrations.networkx_adapter import (
     requires_networkx,
 )
 
-try:
-    from packages.integrations.graph_tool_adapter import (
-        GRAPH_TOOL_AVAILABLE,
-        GraphToolAdapter,
-        GraphToolVisualizer,
-        requires_graph_tool,
-    )
-except ImportError:
-    GRAPH_TOOL_AVAILABLE = False
-    GraphToolAdapter = None
-    GraphToolVisualizer = None
-    requires_graph_tool = None
+# graph-tool's extension is slow to import, so its adapter loads on first access
+_GRAPH_TOOL_NAMES = frozenset(
+    {"GraphToolAdapter", "GraphToolVisualizer", "GRAPH_TOOL_AVAILABLE", "requires_graph_tool"}
+)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the graph-tool adapter lazily (PEP 562)."""
+    if name not in _GRAPH_TOOL_NAMES:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    try:
+        from packages.integrations import graph_tool_adapter
+    except ImportError:
+        value = False if name == "GRAPH_TOOL_AVAILABLE" else None
+    else:
+        value = getattr(graph_tool_adapter, name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "NetworkXAdapter",
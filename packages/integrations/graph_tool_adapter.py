@@ -269,7 +269,7 @@ class GraphToolAdapter:
                 if prop_name != "original_id":  # Skip our internal ID
                     attrs[prop_name] = gt_graph.vp[prop_name][v]
 
-            graph.add_vertex(vertex_id, **attrs)
+            graph.add_vertex(vertex_id, attributes=attrs)
 
         # Add edges
         for e in gt_graph.edges():
@@ -287,7 +287,7 @@ class GraphToolAdapter:
                 if prop_name != "weight":  # Skip weight (handled separately)
                     attrs[prop_name] = gt_graph.ep[prop_name][e]
 
-            graph.add_edge(source, target, weight=weight, **attrs)
+            graph.add_edge(source, target, weight=weight, attributes=attrs)
 
         return graph
 
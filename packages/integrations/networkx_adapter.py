@@ -6,18 +6,37 @@ Provides bidirectional conversion between graph-library and NetworkX graphs.
 
 from __future__ import annotations
 
+from importlib.util import find_spec
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from packages.core.base_graph import BaseGraph
 
-try:
-    import networkx as nx
+# Probe for NetworkX without importing it; the import itself is deferred
+# to first use because it dominates the import time of this package.
+NETWORKX_AVAILABLE = find_spec("networkx") is not None
 
-    NETWORKX_AVAILABLE = True
-except ImportError:
-    NETWORKX_AVAILABLE = False
-    nx = None  # type: ignore
+
+def _import_networkx() -> Any:
+    """
+    Import NetworkX on first use.
+
+    Returns:
+        The networkx module
+
+    Raises:
+        ImportError: If NetworkX is not installed
+    """
+    if not NETWORKX_AVAILABLE:
+        msg = (
+            "NetworkX is not installed. "
+            "Install it with: pip install networkx"
+        )
+        raise ImportError(msg)
+
+    import networkx
+
+    return networkx
 
 
 class NetworkXAdapter:
@@ -74,7 +93,7 @@ class NetworkXAdapter:
             >>> nx_graph.number_of_nodes()
             2
         """
-        NetworkXAdapter._check_networkx_available()
+        nx = _import_networkx()
 
         # Handle Hypergraph via bipartite representation
         from packages.graphs.hypergraph import Hypergraph
@@ -159,16 +178,18 @@ class NetworkXAdapter:
         # Create graph
         graph = graph_class(directed=directed)
 
-        # Add vertices with attributes
-        for node in nx_graph.nodes():
-            attrs = nx_graph.nodes[node].copy()
-            graph.add_vertex(node, **attrs)
+        with graph.bulk_mutation():
+            # Add vertices with attributes
+            # Pass metadata as a dict so keys like "attributes" aren't
+            # mistaken for keyword arguments
+            for node in nx_graph.nodes():
+                graph.add_vertex(node, attributes=dict(nx_graph.nodes[node]))
 
-        # Add edges with attributes
-        for source, target in nx_graph.edges():
-            edge_data = nx_graph.edges[source, target].copy()
-            weight = edge_data.pop("weight", 1.0)
-            graph.add_edge(source, target, weight=weight, **edge_data)
+            # Add edges with attributes
+            for source, target in nx_graph.edges():
+                edge_data = dict(nx_graph.edges[source, target])
+                weight = edge_data.pop("weight", 1.0)
+                graph.add_edge(source, target, weight=weight, attributes=edge_data)
 
         return graph
 
@@ -263,7 +284,7 @@ class NetworkXAlgorithms:
             >>> centrality = NetworkXAlgorithms.betweenness_centrality(graph)
             >>> most_central = max(centrality, key=centrality.get)
         """
-        NetworkXAlgorithms._check_networkx_available()
+        nx = _import_networkx()
         return NetworkXAdapter.apply_networkx_algorithm(
             graph,
             nx.betweenness_centrality,
@@ -285,7 +306,7 @@ class NetworkXAlgorithms:
         Examples:
             >>> centrality = NetworkXAlgorithms.closeness_centrality(graph)
         """
-        NetworkXAlgorithms._check_networkx_available()
+        nx = _import_networkx()
         return NetworkXAdapter.apply_networkx_algorithm(
             graph,
             nx.closeness_centrality,
@@ -308,7 +329,7 @@ class NetworkXAlgorithms:
             >>> ranks = NetworkXAlgorithms.pagerank(graph, alpha=0.85)
             >>> top_ranked = sorted(ranks.items(), key=lambda x: x[1], reverse=True)[:5]
         """
-        NetworkXAlgorithms._check_networkx_available()
+        nx = _import_networkx()
         return NetworkXAdapter.apply_networkx_algorithm(
             graph,
             nx.pagerank,
@@ -331,7 +352,7 @@ class NetworkXAlgorithms:
             >>> communities = NetworkXAlgorithms.detect_communities(graph)
             >>> print(f"Found {len(communities)} communities")
         """
-        NetworkXAlgorithms._check_networkx_available()
+        nx = _import_networkx()
 
         if method == "greedy":
             result = NetworkXAdapter.apply_networkx_algorithm(
@@ -373,7 +394,7 @@ class NetworkXAlgorithms:
             >>> paths = NetworkXAlgorithms.all_pairs_shortest_path(graph)
             >>> path_a_to_c = paths["A"]["C"]
         """
-        NetworkXAlgorithms._check_networkx_available()
+        nx = _import_networkx()
         return dict(
             NetworkXAdapter.apply_networkx_algorithm(
                 graph,
@@ -398,7 +419,7 @@ class NetworkXAlgorithms:
             >>> mst = NetworkXAlgorithms.minimum_spanning_tree(graph)
             >>> print(f"MST has {mst.edge_count()} edges")
         """
-        NetworkXAlgorithms._check_networkx_available()
+        nx = _import_networkx()
 
         nx_graph = NetworkXAdapter.to_networkx(graph)
         mst_nx = nx.minimum_spanning_tree(nx_graph, **kwargs)
@@ -424,7 +445,7 @@ class NetworkXAlgorithms:
             >>> if NetworkXAlgorithms.is_connected(graph):
             ...     print("Graph is connected")
         """
-        NetworkXAlgorithms._check_networkx_available()
+        nx = _import_networkx()
         return NetworkXAdapter.apply_networkx_algorithm(
             graph,
             nx.is_connected if not graph._directed else nx.is_strongly_connected,
@@ -446,7 +467,7 @@ class NetworkXAlgorithms:
             >>> clustering = NetworkXAlgorithms.clustering_coefficient(graph)
             >>> avg_clustering = sum(clustering.values()) / len(clustering)
         """
-        NetworkXAlgorithms._check_networkx_available()
+        nx = _import_networkx()
         return NetworkXAdapter.apply_networkx_algorithm(
             graph,
             nx.clustering,
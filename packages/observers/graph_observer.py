@@ -41,6 +41,9 @@ class GraphObserver(ABC):
                 - "edge_added": args = (source, target)
                 - "edge_removed": args = (source, target)
                 - "representation_changed": args = (new_repr_type,)
+                - "bulk_loaded": args = (vertex_count, edge_count)
+                - "bulk_mutated": args = (vertex_delta, edge_delta) (end of a
+                  bulk_mutation() block)
             *args: Event-specific positional arguments
             **kwargs: Event-specific keyword arguments
         """
@@ -22,7 +22,11 @@ from __future__ import annotations
 from collections import defaultdict
 from typing import TYPE_CHECKING, Any
 
-from packages.representations.base_representation import GraphRepresentation
+from packages.representations.base_representation import (
+    GraphRepresentation,
+    RepresentationKind,
+)
+from packages.utils.exceptions import VertexNotFoundError
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
@@ -55,6 +59,8 @@ class AdjacencyListRepresentation(GraphRepresentation):
 
     __slots__ = ("_adj_list", "_vertices", "_edges", "_directed")
 
+    kind = RepresentationKind.ADJACENCY_LIST
+
     def __init__(self, *, directed: bool = False) -> None:
         """
         Initialize adjacency list representation.
@@ -96,15 +102,15 @@ class AdjacencyListRepresentation(GraphRepresentation):
             edge: Edge object to add
 
         Raises:
-            KeyError: If source or target vertex doesn't exist
+            VertexNotFoundError: If source or target vertex doesn't exist
             ValueError: If edge already exists
         """
         if edge.source not in self._vertices:
             msg = f"Source vertex {edge.source!r} not found"
-            raise KeyError(msg)
+            raise VertexNotFoundError(msg)
         if edge.target not in self._vertices:
             msg = f"Target vertex {edge.target!r} not found"
-            raise KeyError(msg)
+            raise VertexNotFoundError(msg)
 
         # Check for existing edge
         edge_key = (edge.source, edge.target)
@@ -296,14 +302,15 @@ class AdjacencyListRepresentation(GraphRepresentation):
         Yields:
             Edge objects
         """
-        seen = set()
+        # Undirected edges are stored under both keys as the same object;
+        # the Edge hash is precomputed and symmetric, so dedup on it directly.
+        seen: set[Edge] = set()
         for edge in self._edges.values():
             # For undirected, avoid duplicates
             if not self._directed:
-                edge_id = frozenset([edge.source, edge.target])
-                if edge_id in seen:
+                if edge in seen:
                     continue
-                seen.add(edge_id)
+                seen.add(edge)
             yield edge
 
     def vertex_count(self) -> int:
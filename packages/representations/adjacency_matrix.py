@@ -23,10 +23,14 @@ from typing import TYPE_CHECKING, Any
 
 import numpy as np
 
-from packages.representations.base_representation import GraphRepresentation
+from packages.representations.base_representation import (
+    GraphRepresentation,
+    RepresentationKind,
+)
+from packages.utils.exceptions import VertexNotFoundError
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterable, Iterator
 
     from packages.core.edge import Edge
     from packages.core.vertex import Vertex
@@ -65,6 +69,8 @@ class AdjacencyMatrixRepresentation(GraphRepresentation):
         "_directed",
     )
 
+    kind = RepresentationKind.ADJACENCY_MATRIX
+
     def __init__(
         self,
         *,
@@ -103,6 +109,16 @@ class AdjacencyMatrixRepresentation(GraphRepresentation):
         new_matrix[:old_size, :old_size] = self._matrix
         self._matrix = new_matrix
 
+    def reserve(self, vertex_count: int, edge_count: int) -> None:
+        """
+        Grow the matrix once so vertex_count more vertices fit without resizes.
+
+        Args:
+            vertex_count: Number of vertices about to be added
+            edge_count: Number of edges about to be added (unused)
+        """
+        self._resize_matrix(len(self._vertices) + vertex_count)
+
     def add_vertex(self, vertex: Vertex) -> None:
         """
         Add a vertex to the matrix.
@@ -140,15 +156,15 @@ class AdjacencyMatrixRepresentation(GraphRepresentation):
             edge: Edge object to add
 
         Raises:
-            KeyError: If source or target vertex doesn't exist
+            VertexNotFoundError: If source or target vertex doesn't exist
             ValueError: If edge already exists
         """
         if edge.source not in self._vertices:
             msg = f"Source vertex {edge.source!r} not found"
-            raise KeyError(msg)
+            raise VertexNotFoundError(msg)
         if edge.target not in self._vertices:
             msg = f"Target vertex {edge.target!r} not found"
-            raise KeyError(msg)
+            raise VertexNotFoundError(msg)
 
         # Get matrix indices
         src_idx = self._vertex_index[edge.source]
@@ -170,6 +186,62 @@ class AdjacencyMatrixRepresentation(GraphRepresentation):
         if not self._directed:
             self._edges[(edge.target, edge.source)] = edge
 
+    def bulk_load(self, vertices: Iterable[Vertex], edges: Iterable[Edge]) -> None:
+        """
+        Add many vertices and edges, writing matrix cells in one step.
+
+        Edges are validated in Python first; the weights are then written
+        with a single NumPy fancy-index assignment instead of one cell at a
+        time. If validation fails no edge from the batch is stored.
+
+        Time Complexity: O(|V| + |E|) plus at most one resize
+
+        Args:
+            vertices: Vertex objects to add
+            edges: Edge objects to add (endpoints must be present)
+
+        Raises:
+            ValueError: If a vertex or edge already exists
+            KeyError: If an edge endpoint doesn't exist
+        """
+        add_vertex = self.add_vertex
+        for vertex in vertices:
+            add_vertex(vertex)
+
+        index = self._vertex_index
+        stored = self._edges
+        directed = self._directed
+        pending: dict[tuple[Any, Any], Edge] = {}
+        for edge in edges:
+            source, target = edge.source, edge.target
+            if source not in index:
+                msg = f"Source vertex {source!r} not found"
+                raise VertexNotFoundError(msg)
+            if target not in index:
+                msg = f"Target vertex {target!r} not found"
+                raise VertexNotFoundError(msg)
+            edge_key = (source, target)
+            if edge_key in stored or edge_key in pending:
+                msg = f"Edge {source!r} -> {target!r} already exists"
+                raise ValueError(msg)
+            pending[edge_key] = edge
+            if not directed:
+                pending[(target, source)] = edge
+
+        if not pending:
+            return
+
+        # Undirected edges are already in pending under both keys, so one
+        # assignment fills the symmetric cells as well.
+        count = len(pending)
+        rows = np.fromiter((index[s] for s, _ in pending), dtype=np.intp, count=count)
+        cols = np.fromiter((index[t] for _, t in pending), dtype=np.intp, count=count)
+        weights = np.fromiter(
+            (e.weight for e in pending.values()), dtype=np.float64, count=count
+        )
+        self._matrix[rows, cols] = weights
+        stored.update(pending)
+
     def remove_vertex(self, vertex_id: Any) -> None:
         """
         Remove a vertex from the matrix.
@@ -296,19 +368,27 @@ class AdjacencyMatrixRepresentation(GraphRepresentation):
             raise KeyError(msg)
         return self._edges[edge_key]
 
+    def get_edge_weight(self, source: Any, target: Any) -> float:
+        """Get edge weight from the matrix cell. Time Complexity: O(1)"""
+        if (source, target) not in self._edges:
+            msg = f"Edge {source!r} -> {target!r} not found"
+            raise KeyError(msg)
+        return float(self._matrix[self._vertex_index[source], self._vertex_index[target]])
+
     def vertices(self) -> Iterator[Vertex]:
         """Iterate over all vertices."""
         yield from self._vertices.values()
 
     def edges(self) -> Iterator[Edge]:
         """Iterate over all edges."""
-        seen = set()
+        # Undirected edges are stored under both keys as the same object;
+        # the Edge hash is precomputed and symmetric, so dedup on it directly.
+        seen: set[Edge] = set()
         for edge in self._edges.values():
             if not self._directed:
-                edge_id = frozenset([edge.source, edge.target])
-                if edge_id in seen:
+                if edge in seen:
                     continue
-                seen.add(edge_id)
+                seen.add(edge)
             yield edge
 
     def vertex_count(self) -> int:
@@ -353,43 +433,46 @@ def to_adjacency_matrix(graph: Any) -> np.ndarray:
     """
     Convert graph to adjacency matrix.
 
+    The matrix is filled with a single vectorized scatter over index arrays
+    instead of building an intermediate AdjacencyMatrixRepresentation edge by
+    edge. Rows and columns follow the order of ``graph.get_vertices()``.
+    When several edges map to the same cell (parallel edges of a multigraph),
+    the first one encountered wins.
+
     Args:
         graph: Source graph
 
     Returns:
-        NumPy 2D array
+        NumPy 2D array of edge weights (0 where no edge exists)
+
+    Examples:
+        >>> graph = SimpleGraph()
+        >>> graph.add_vertex("A")
+        >>> graph.add_vertex("B")
+        >>> graph.add_edge("A", "B", weight=2.0)
+        >>> to_adjacency_matrix(graph)
+        array([[0., 2.],
+               [2., 0.]])
     """
-    from packages.representations.adjacency_matrix import AdjacencyMatrixRepresentation
-    
-    # If the graph already uses AdjacencyMatrixRepresentation, convert directly
-    # But graph._representation is private/internal concept.
-    # It is safer to build a new AdjacencyMatrixRepresentation from the graph content.
-    
-    # Using the class directly deals with indices mapping
-    matrix_repr = AdjacencyMatrixRepresentation(
-        directed=graph.is_directed(),
-        initial_capacity=len(graph.get_vertices())
-    )
-    
-    for vertex in graph.vertices():
-        matrix_repr.add_vertex(vertex)
-        
-    # Add edges
-    # Note: For MultiGraph, this will summation or overwrite depending on implementation logic.
-    # AdjacencyMatrixRepresentation raises ValueError on duplicate edges if non-zero.
-    # But standard to_adjacency_matrix usually sums weights or takes max/min.
-    # Here we just iterate and add. If it fails due to existing edge, we might need a strategy.
-    # But standard Simple/Pseudo graphs work fine.
-    
-    for edge in graph.edges():
-        if matrix_repr.has_edge(edge.source, edge.target):
-            # If edge exists (e.g. Multigraph), we might want to sum weights for matrix representation?
-            # Or just ignore (simple graph logic).
-            # The current AdjacencyMatrixRepresentation raises ValueError.
-            # Let's try to add safe handling?
-            # For now, let's assume it works for Simple/Pseudo.
-            continue
-            
-        matrix_repr.add_edge(edge)
-        
-    return matrix_repr.get_matrix()
+    index = {vertex.id: i for i, vertex in enumerate(graph.vertices())}
+    n = len(index)
+    matrix = np.zeros((n, n), dtype=np.float64)
+
+    edges = list(graph.edges())
+    if not edges:
+        return matrix
+
+    count = len(edges)
+    src = np.fromiter((index[e.source] for e in edges), dtype=np.intp, count=count)
+    tgt = np.fromiter((index[e.target] for e in edges), dtype=np.intp, count=count)
+    weights = np.fromiter((e.weight for e in edges), dtype=np.float64, count=count)
+
+    if not graph.is_directed():
+        # Interleave both orientations so iteration order is kept per cell
+        src, tgt = np.column_stack((src, tgt)).ravel(), np.column_stack((tgt, src)).ravel()
+        weights = np.repeat(weights, 2)
+
+    # Keep only the first edge written to each cell
+    _, first = np.unique(src * n + tgt, return_index=True)
+    matrix[src[first], tgt[first]] = weights[first]
+    return matrix
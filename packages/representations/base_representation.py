@@ -8,15 +8,35 @@ allowing dynamic switching between adjacency list, matrix, and edge list formats
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any, ClassVar
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterable, Iterator
 
     from packages.core.edge import Edge
     from packages.core.vertex import Vertex
 
 
+class RepresentationKind(StrEnum):
+    """
+    Identifier of a representation strategy.
+
+    Values match the ``representation`` strings accepted by graph
+    constructors, so members compare equal to those plain strings.
+
+    Examples:
+        >>> RepresentationKind.ADJACENCY_MATRIX == "adjacency_matrix"
+        True
+    """
+
+    ADJACENCY_LIST = "adjacency_list"
+    ADJACENCY_MATRIX = "adjacency_matrix"
+    EDGE_LIST = "edge_list"
+    MULTIGRAPH = "multigraph"
+    HYPERGRAPH = "hypergraph"
+
+
 class GraphRepresentation(ABC):
     """
     Abstract base class for graph representation strategies.
@@ -26,7 +46,10 @@ class GraphRepresentation(ABC):
     at runtime based on performance characteristics.
 
     Subclasses must implement all abstract methods to provide a complete
-    representation strategy.
+    representation strategy and set ``kind`` to identify themselves.
+
+    Attributes:
+        kind: Which representation strategy this class implements
 
     Examples:
         >>> repr = AdjacencyListRepresentation()
@@ -36,6 +59,8 @@ class GraphRepresentation(ABC):
 
     __slots__ = ()
 
+    kind: ClassVar[RepresentationKind]
+
     @abstractmethod
     def add_vertex(self, vertex: Vertex) -> None:
         """
@@ -58,7 +83,7 @@ class GraphRepresentation(ABC):
             edge: Edge object to add
 
         Raises:
-            KeyError: If source or target vertex doesn't exist
+            VertexNotFoundError: If source or target vertex doesn't exist
             ValueError: If edge already exists (for non-multi graphs)
         """
         ...
@@ -190,3 +215,59 @@ class GraphRepresentation(ABC):
     def clear(self) -> None:
         """Remove all vertices and edges."""
         ...
+
+    def get_edge_weight(self, source: Any, target: Any) -> float:
+        """
+        Get the weight of the edge between source and target.
+
+        The default reads the stored Edge; representations that keep
+        weights in a flat structure (such as a matrix) override it.
+
+        Args:
+            source: Source vertex identifier
+            target: Target vertex identifier
+
+        Returns:
+            Edge weight
+
+        Raises:
+            KeyError: If edge doesn't exist
+        """
+        return self.get_edge(source, target).weight
+
+    # Optional hook with a no-op default, so it is deliberately not abstract
+    def reserve(self, vertex_count: int, edge_count: int) -> None:  # noqa: B027
+        """
+        Pre-size internal storage ahead of a bulk load.
+
+        The default implementation does nothing; representations with
+        expensive growth (such as a matrix resize) override it.
+
+        Args:
+            vertex_count: Number of vertices about to be added
+            edge_count: Number of edges about to be added
+        """
+
+    def bulk_load(self, vertices: Iterable[Vertex], edges: Iterable[Any]) -> None:
+        """
+        Add many vertices and then many edges.
+
+        Vertex and edge objects are stored as given. The same existence and
+        duplicate checks as add_vertex/add_edge apply.
+
+        Args:
+            vertices: Vertex objects to add
+            edges: Edge objects to add, or the representation's own edge
+                type such as Hyperedge (endpoints must be present)
+
+        Raises:
+            ValueError: If a vertex or edge already exists
+            KeyError: If an edge endpoint doesn't exist
+        """
+        add_vertex = self.add_vertex
+        for vertex in vertices:
+            add_vertex(vertex)
+
+        add_edge = self.add_edge
+        for edge in edges:
+            add_edge(edge)
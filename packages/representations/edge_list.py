@@ -19,7 +19,11 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from packages.representations.base_representation import GraphRepresentation
+from packages.representations.base_representation import (
+    GraphRepresentation,
+    RepresentationKind,
+)
+from packages.utils.exceptions import VertexNotFoundError
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
@@ -60,6 +64,8 @@ class EdgeListRepresentation(GraphRepresentation):
 
     __slots__ = ("_vertices", "_edges", "_directed")
 
+    kind = RepresentationKind.EDGE_LIST
+
     def __init__(self, *, directed: bool = False) -> None:
         """
         Initialize edge list representation.
@@ -98,15 +104,15 @@ class EdgeListRepresentation(GraphRepresentation):
             edge: Edge object to add
 
         Raises:
-            KeyError: If source or target vertex doesn't exist
+            VertexNotFoundError: If source or target vertex doesn't exist
             ValueError: If edge already exists
         """
         if edge.source not in self._vertices:
             msg = f"Source vertex {edge.source!r} not found"
-            raise KeyError(msg)
+            raise VertexNotFoundError(msg)
         if edge.target not in self._vertices:
             msg = f"Target vertex {edge.target!r} not found"
-            raise KeyError(msg)
+            raise VertexNotFoundError(msg)
 
         # Check for duplicates (O(E) operation)
         if self.has_edge(edge.source, edge.target):
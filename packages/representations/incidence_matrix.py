@@ -8,7 +8,7 @@ M[v, e] = 1 if vertex v is contained in hyperedge e.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
 import numpy as np
 
@@ -35,23 +35,11 @@ def to_incidence_matrix(graph: Hypergraph) -> np.ndarray:
         msg = f"Expected Hypergraph, got {type(graph).__name__}"
         raise TypeError(msg)
 
-    vertices = list(graph.vertices())
-    hyperedges = list(graph.edges())
-    
-    n_vertices = len(vertices)
-    n_edges = len(hyperedges)
-    
-    # Create vertex index mapping
-    vertex_to_idx = {v.id: i for i, v in enumerate(vertices)}
-    
-    # Initialize matrix
-    matrix = np.zeros((n_vertices, n_edges), dtype=np.int8)
-    
-    # Fill matrix
-    for j, hyperedge in enumerate(hyperedges):
-        for vertex_id in hyperedge.vertices:
-            if vertex_id in vertex_to_idx:
-                i = vertex_to_idx[vertex_id]
-                matrix[i, j] = 1
-                
+    # Column j's rows are indices[indptr[j]:indptr[j + 1]]; fill them all at once
+    indptr, indices = graph.to_csr()
+    n_edges = len(indptr) - 1
+    columns = np.repeat(np.arange(n_edges), np.diff(indptr))
+
+    matrix = np.zeros((graph.vertex_count(), n_edges), dtype=np.int8)
+    matrix[indices, columns] = 1
     return matrix
@@ -9,11 +9,65 @@ from __future__ import annotations
 import json
 import pickle
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Final
+
+from pydantic import BaseModel, ConfigDict, Field
 
 if TYPE_CHECKING:
     from packages.core.base_graph import BaseGraph
 
+# Representation class name (as stored in documents) -> factory name
+_REPRESENTATION_NAMES: Final[dict[str, str]] = {
+    "AdjacencyListRepresentation": "adjacency_list",
+    "AdjacencyMatrixRepresentation": "adjacency_matrix",
+    "EdgeListRepresentation": "edge_list",
+}
+
+
+class VertexRecord(BaseModel):
+    """Serialized vertex entry of a graph document."""
+
+    model_config = ConfigDict(strict=False)
+
+    id: Any
+    attributes: dict[str, Any] = Field(default_factory=dict)
+
+
+class EdgeRecord(BaseModel):
+    """Serialized edge entry of a graph document."""
+
+    model_config = ConfigDict(strict=False)
+
+    source: Any
+    target: Any
+    weight: float = 1.0
+    directed: bool = False
+    attributes: dict[str, Any] = Field(default_factory=dict)
+
+
+class GraphDocument(BaseModel):
+    """
+    Schema of the document produced by GraphSerializer.to_dict.
+
+    Validation runs in pydantic-core, so ``GraphDocument.model_validate_json``
+    parses and validates raw JSON in a single pass without building an
+    intermediate dictionary.
+
+    Examples:
+        >>> doc = GraphDocument.model_validate_json(b'{"graph_type": "SimpleGraph"}')
+        >>> doc.vertices
+        []
+    """
+
+    model_config = ConfigDict(strict=False)
+
+    graph_type: str
+    directed: bool = False
+    representation: str = "AdjacencyListRepresentation"
+    vertices: list[VertexRecord] = Field(default_factory=list)
+    edges: list[EdgeRecord] = Field(default_factory=list)
+    metadata: dict[str, Any] = Field(default_factory=dict)
+
 
 class GraphSerializer:
     """
@@ -84,12 +138,28 @@ class GraphSerializer:
             Reconstructed graph instance
 
         Raises:
-            ValueError: If graph_type is not supported
+            ValueError: If graph_type is not supported or data is malformed
 
         Examples:
             >>> data = {"graph_type": "SimpleGraph", ...}
             >>> graph = GraphSerializer.from_dict(data)
         """
+        return GraphSerializer.from_document(GraphDocument.model_validate(data))
+
+    @staticmethod
+    def from_document(document: GraphDocument) -> BaseGraph:
+        """
+        Reconstruct graph from a validated document.
+
+        Args:
+            document: Validated graph document
+
+        Returns:
+            Reconstructed graph instance
+
+        Raises:
+            ValueError: If graph_type is not supported
+        """
         from packages.graphs.hypergraph import Hypergraph
         from packages.graphs.multigraph import Multigraph
         from packages.graphs.pseudograph import Pseudograph
@@ -103,7 +173,7 @@ class GraphSerializer:
             "Hypergraph": Hypergraph,
         }
 
-        graph_type = data.get("graph_type")
+        graph_type = document.graph_type
         if graph_type not in graph_types:
             supported = ", ".join(graph_types.keys())
             msg = f"Unsupported graph type: {graph_type!r}. Supported: {supported}"
@@ -112,41 +182,31 @@ class GraphSerializer:
         # Create graph instance
         graph_class = graph_types[graph_type]
         
-        # Map representation names
-        repr_map = {
-            "AdjacencyListRepresentation": "adjacency_list",
-            "AdjacencyMatrixRepresentation": "adjacency_matrix",
-            "EdgeListRepresentation": "edge_list",
-        }
-        
-        repr_name = data.get("representation", "AdjacencyListRepresentation")
-        repr_type = repr_map.get(repr_name, "adjacency_list")
+        repr_type = _REPRESENTATION_NAMES.get(document.representation, "adjacency_list")
         
         graph = graph_class(
-            directed=data.get("directed", False),
+            directed=document.directed,
             representation=repr_type,
         )
 
-        # Restore vertices
-        for vertex_data in data.get("vertices", []):
-            graph.add_vertex(
-                vertex_data["id"],
-                **vertex_data.get("attributes", {}),
-            )
-
-        # Restore edges
-        for edge_data in data.get("edges", []):
-            if graph_type == "Hypergraph":
-                # Hypergraph edges need special handling
-                # For now, skip or implement hyperedge restoration
-                pass
-            else:
-                graph.add_edge(
-                    edge_data["source"],
-                    edge_data["target"],
-                    weight=edge_data.get("weight", 1.0),
-                    **edge_data.get("attributes", {}),
-                )
+        add_vertex = graph.add_vertex
+        add_edge = graph.add_edge
+
+        with graph.bulk_mutation():
+            # Restore vertices
+            for vertex_data in document.vertices:
+                add_vertex(vertex_data.id, attributes=vertex_data.attributes)
+
+            # Restore edges. Hypergraph edges need special handling; for now
+            # they are skipped rather than restored.
+            if graph_type != "Hypergraph":
+                for edge_data in document.edges:
+                    add_edge(
+                        edge_data.source,
+                        edge_data.target,
+                        weight=edge_data.weight,
+                        attributes=edge_data.attributes,
+                    )
 
         return graph
 
@@ -189,6 +249,10 @@ class JSONSerializer:
         """
         Load graph from JSON file.
 
+        The raw bytes are parsed and validated against GraphDocument in a
+        single pass, so malformed files are rejected before any graph object
+        is built.
+
         Args:
             filepath: Path to input file
 
@@ -197,17 +261,14 @@ class JSONSerializer:
 
         Raises:
             FileNotFoundError: If file doesn't exist
-            json.JSONDecodeError: If file is not valid JSON
+            pydantic.ValidationError: If file is not a valid graph document
 
         Examples:
             >>> graph = JSONSerializer.load("graph.json")
         """
         filepath = Path(filepath)
-
-        with filepath.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        return GraphSerializer.from_dict(data)
+        document = GraphDocument.model_validate_json(filepath.read_bytes())
+        return GraphSerializer.from_document(document)
 
     @staticmethod
     def dumps(graph: BaseGraph, *, indent: int = 2) -> str:
@@ -233,17 +294,22 @@ class JSONSerializer:
         """
         Deserialize graph from JSON string.
 
+        Parsing and validation happen in one pass inside pydantic-core.
+
         Args:
             json_str: JSON string to parse
 
         Returns:
             Graph instance
 
+        Raises:
+            pydantic.ValidationError: If the string is not a valid graph document
+
         Examples:
             >>> graph = JSONSerializer.loads('{"graph_type": "SimpleGraph", ...}')
         """
-        data = json.loads(json_str)
-        return GraphSerializer.from_dict(data)
+        document = GraphDocument.model_validate_json(json_str)
+        return GraphSerializer.from_document(document)
 
 
 class PickleSerializer:
@@ -342,6 +408,35 @@ class PickleSerializer:
         return pickle.loads(data)
 
 
+# File suffix -> serializer, consulted by GraphIO
+_SERIALIZERS: Final[dict[str, type[JSONSerializer] | type[PickleSerializer]]] = {
+    ".json": JSONSerializer,
+    ".pkl": PickleSerializer,
+    ".pickle": PickleSerializer,
+}
+
+
+def _serializer_for(filepath: Path) -> type[JSONSerializer] | type[PickleSerializer]:
+    """
+    Resolve the serializer for a file path from its suffix.
+
+    Args:
+        filepath: File path to inspect
+
+    Returns:
+        Serializer class handling the suffix
+
+    Raises:
+        ValueError: If file extension is not supported
+    """
+    suffix = filepath.suffix.lower()
+    serializer = _SERIALIZERS.get(suffix)
+    if serializer is None:
+        msg = f"Unsupported format: {suffix}. Use .json or .pkl"
+        raise ValueError(msg)
+    return serializer
+
+
 class GraphIO:
     """
     Convenience interface for graph I/O operations.
@@ -376,15 +471,7 @@ class GraphIO:
             >>> GraphIO.save(graph, "output.pkl")
         """
         filepath = Path(filepath)
-        suffix = filepath.suffix.lower()
-
-        if suffix == ".json":
-            JSONSerializer.save(graph, filepath, **kwargs)
-        elif suffix in {".pkl", ".pickle"}:
-            PickleSerializer.save(graph, filepath, **kwargs)
-        else:
-            msg = f"Unsupported format: {suffix}. Use .json or .pkl"
-            raise ValueError(msg)
+        _serializer_for(filepath).save(graph, filepath, **kwargs)
 
     @staticmethod
     def load(filepath: str | Path) -> BaseGraph:
@@ -405,15 +492,7 @@ class GraphIO:
             >>> graph = GraphIO.load("input.pkl")
         """
         filepath = Path(filepath)
-        suffix = filepath.suffix.lower()
-
-        if suffix == ".json":
-            return JSONSerializer.load(filepath)
-        elif suffix in {".pkl", ".pickle"}:
-            return PickleSerializer.load(filepath)
-        else:
-            msg = f"Unsupported format: {suffix}. Use .json or .pkl"
-            raise ValueError(msg)
+        return _serializer_for(filepath).load(filepath)
 
 
 # Convenience functions at module level
@@ -10,8 +10,6 @@ from __future__ import annotations
 import math
 from typing import Any
 
-from pydantic import field_validator
-
 
 def validate_weight(weight: float) -> float:
     """
@@ -64,12 +62,12 @@ def validate_vertex_id(vertex_id: Any) -> Any:
     return vertex_id
 
 
-def validate_hyperedge_vertices(vertices: set[Any]) -> set[Any]:
+def validate_hyperedge_vertices(vertices: frozenset[Any]) -> frozenset[Any]:
     """
     Validate hyperedge contains at least 2 vertices.
 
     Args:
-        vertices: Set of vertex identifiers
+        vertices: Frozenset of vertex identifiers
 
     Returns:
         Validated vertex set
@@ -0,0 +1,125 @@
+"""
+Unit tests for BaseGraph shared behavior.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from packages.core.edge import Edge
+from packages.graphs.simple_graph import SimpleGraph
+from packages.observers.change_tracker import ChangeLogger
+from packages.utils.exceptions import GraphConstraintError
+
+if TYPE_CHECKING:
+    from packages.graphs.hypergraph import Hypergraph
+    from packages.graphs.pseudograph import Pseudograph
+
+
+class TestBaseGraphCounts:
+    """Test size queries shared by all graph types."""
+
+    def test_counts_do_not_iterate(
+        self,
+        sample_simple_graph: SimpleGraph,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test counts come from the representation, not a full traversal."""
+
+        def fail() -> None:
+            raise AssertionError("iterated the graph")
+
+        monkeypatch.setattr(SimpleGraph, "vertices", fail)
+        monkeypatch.setattr(SimpleGraph, "edges", fail)
+
+        assert sample_simple_graph.vertex_count() == 3
+        assert sample_simple_graph.edge_count() == 2
+        assert len(sample_simple_graph) == 3
+        assert repr(sample_simple_graph) == "SimpleGraph(vertices=3, edges=2, directed=False)"
+
+    def test_hypergraph_counts(self, sample_hypergraph: Hypergraph) -> None:
+        """Test hypergraph counts hyperedges as edges."""
+        assert sample_hypergraph.vertex_count() == 4
+        assert sample_hypergraph.edge_count() == 2
+
+
+class TestBaseGraphBulkLoad:
+    """Test the bulk_load fast path."""
+
+    def test_bulk_load_copies_structure(self, sample_simple_graph: SimpleGraph) -> None:
+        """Test vertices, edges and attributes are carried over."""
+        copy = SimpleGraph(representation="adjacency_matrix")
+        copy.bulk_load(sample_simple_graph.vertices(), sample_simple_graph.edges())
+
+        assert copy.vertex_count() == 3
+        assert copy.edge_count() == 2
+        assert copy.get_vertex("A").get_attribute("color") == "red"
+        assert copy.get_edge("A", "B").weight == 5.0
+
+    def test_bulk_load_notifies_once(self, sample_simple_graph: SimpleGraph) -> None:
+        """Test observers receive one consolidated event."""
+        copy = SimpleGraph()
+        logger = ChangeLogger()
+        copy.attach_observer(logger)
+
+        copy.bulk_load(sample_simple_graph.vertices(), sample_simple_graph.edges())
+
+        assert logger.get_history() == [("bulk_loaded", (3, 2))]
+
+    def test_bulk_load_enforces_constraints(self, sample_pseudograph: Pseudograph) -> None:
+        """Test self-loops are still rejected by simple graphs."""
+        simple = SimpleGraph()
+
+        with pytest.raises(GraphConstraintError, match="self-loop"):
+            simple.bulk_load(sample_pseudograph.vertices(), sample_pseudograph.edges())
+
+        assert simple.vertex_count() == 0
+
+    def test_bulk_load_rejects_unknown_endpoint(self) -> None:
+        """Test edges must reference loaded vertices."""
+        graph = SimpleGraph()
+
+        with pytest.raises(KeyError):
+            graph.bulk_load([], [Edge(source="A", target="B")])
+
+
+class TestBulkMutation:
+    """Test batching observer notifications."""
+
+    def test_single_event_for_block(self, empty_simple_graph: SimpleGraph) -> None:
+        """Test per-element events are replaced by one event at exit."""
+        logger = ChangeLogger()
+        empty_simple_graph.attach_observer(logger)
+
+        with empty_simple_graph.bulk_mutation():
+            empty_simple_graph.add_vertex("A")
+            empty_simple_graph.add_vertex("B")
+            empty_simple_graph.add_edge("A", "B")
+
+        assert logger.get_history() == [("bulk_mutated", (2, 1))]
+
+    def test_nested_blocks_notify_once(self, empty_simple_graph: SimpleGraph) -> None:
+        """Test only the outermost block fires the event."""
+        logger = ChangeLogger()
+        empty_simple_graph.attach_observer(logger)
+
+        with empty_simple_graph.bulk_mutation():
+            with empty_simple_graph.bulk_mutation():
+                empty_simple_graph.add_vertex("A")
+            empty_simple_graph.add_vertex("B")
+        empty_simple_graph.add_vertex("C")
+
+        assert logger.get_history() == [("bulk_mutated", (2, 0)), ("vertex_added", ("C",))]
+
+    def test_event_reports_net_change(self, sample_simple_graph: SimpleGraph) -> None:
+        """Test removals inside the block produce negative deltas."""
+        logger = ChangeLogger()
+        sample_simple_graph.attach_observer(logger)
+
+        with sample_simple_graph.bulk_mutation():
+            sample_simple_graph.remove_vertex("C")
+            sample_simple_graph.add_vertex("D")
+
+        assert logger.get_history() == [("bulk_mutated", (0, -1))]
@@ -0,0 +1,189 @@
+"""
+Unit tests for graph converters.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from packages.converters.format_converters import (
+    from_adjacency_dict,
+    to_adjacency_dict,
+    to_edge_list_iter,
+    to_edge_list_tuples,
+)
+from packages.converters.graph_converters import (
+    multigraph_to_simple,
+    pseudograph_to_simple,
+)
+from packages.converters.representation_converters import RepresentationConverter
+from packages.graphs.multigraph import Multigraph
+from packages.graphs.pseudograph import Pseudograph
+from packages.graphs.simple_graph import SimpleGraph
+
+
+class TestGraphConverters:
+    """Test conversions between graph types."""
+
+    @pytest.mark.parametrize(
+        ("strategy", "expected"),
+        [("min", 3.0), ("max", 5.0), ("sum", 8.0), ("avg", 4.0)],
+    )
+    def test_multigraph_to_simple_merges_parallel_edges(
+        self,
+        sample_multigraph: Multigraph,
+        strategy: str,
+        expected: float,
+    ) -> None:
+        """Test each merge strategy reduces parallel weights."""
+        simple = multigraph_to_simple(sample_multigraph, merge_strategy=strategy)
+
+        assert simple.edge_count() == 1
+        assert simple.get_edge("A", "B").weight == expected
+
+    def test_multigraph_to_simple_merges_opposite_orientations(self) -> None:
+        """Test undirected A-B and B-A parallels merge into one edge."""
+        multi = Multigraph()
+        multi.add_vertex("A")
+        multi.add_vertex("B")
+        multi.add_edge("A", "B", weight=3.0)
+        multi.add_edge("B", "A", weight=5.0)
+
+        simple = multigraph_to_simple(multi, merge_strategy="sum")
+
+        assert simple.edge_count() == 1
+        assert simple.get_edge("A", "B").weight == 8.0
+
+    def test_multigraph_to_simple_directed_keeps_orientations(self) -> None:
+        """Test directed A->B and B->A stay separate edges."""
+        multi = Multigraph(directed=True)
+        multi.add_vertex("A")
+        multi.add_vertex("B")
+        multi.add_edge("A", "B", weight=3.0)
+        multi.add_edge("B", "A", weight=5.0)
+
+        simple = multigraph_to_simple(multi)
+
+        assert simple.edge_count() == 2
+        assert simple.get_edge("B", "A").weight == 5.0
+
+    def test_multigraph_to_simple_invalid_strategy_raises(
+        self,
+        sample_multigraph: Multigraph,
+    ) -> None:
+        """Test unknown merge strategies are rejected."""
+        with pytest.raises(ValueError, match="merge_strategy"):
+            multigraph_to_simple(sample_multigraph, merge_strategy="median")
+
+    def test_pseudograph_to_simple_invalid_strategy_raises(
+        self,
+        sample_pseudograph: Pseudograph,
+    ) -> None:
+        """Test unknown merge strategies are rejected with ValueError."""
+        with pytest.raises(ValueError, match="merge_strategy"):
+            pseudograph_to_simple(sample_pseudograph, merge_strategy="median")
+
+    def test_pseudograph_to_simple_merges_opposite_orientations(self) -> None:
+        """Test undirected A-B and B-A parallels merge into one edge."""
+        pseudo = Pseudograph()
+        pseudo.add_vertex("A")
+        pseudo.add_vertex("B")
+        pseudo.add_edge("A", "B", weight=3.0)
+        pseudo.add_edge("B", "A", weight=5.0)
+
+        simple = pseudograph_to_simple(pseudo, merge_strategy="avg")
+
+        assert simple.edge_count() == 1
+        assert simple.get_edge("B", "A").weight == 4.0
+
+    def test_pseudograph_to_simple_drops_loops(
+        self,
+        sample_pseudograph: Pseudograph,
+    ) -> None:
+        """Test self-loops are removed and remaining edges kept."""
+        simple = pseudograph_to_simple(sample_pseudograph)
+
+        assert not simple.has_edge("A", "A")
+        assert simple.get_edge("A", "B").weight == 2.0
+
+
+class TestFormatConverters:
+    """Test conversions to and from native Python structures."""
+
+    def test_to_adjacency_dict_undirected(self, sample_simple_graph: SimpleGraph) -> None:
+        """Test undirected edges appear in both directions."""
+        data = to_adjacency_dict(sample_simple_graph)
+
+        assert data == {
+            "A": {"B": 5.0},
+            "B": {"A": 5.0, "C": 3.0},
+            "C": {"B": 3.0},
+        }
+
+    def test_to_adjacency_dict_keeps_isolated_vertices(self) -> None:
+        """Test vertices without edges are exported."""
+        graph = SimpleGraph(directed=True)
+        graph.add_vertex("A")
+        graph.add_vertex("B")
+        graph.add_vertex("C")
+        graph.add_edge("A", "B", weight=2.0)
+
+        assert to_adjacency_dict(graph) == {"A": {"B": 2.0}, "B": {}, "C": {}}
+
+    def test_edge_list_iter_matches_tuples(self, sample_simple_graph: SimpleGraph) -> None:
+        """Test the lazy iterator yields the same tuples as the list export."""
+        edges = to_edge_list_iter(sample_simple_graph)
+
+        assert not isinstance(edges, list)
+        assert list(edges) == to_edge_list_tuples(sample_simple_graph)
+
+    def test_adjacency_dict_roundtrip(self, sample_simple_graph: SimpleGraph) -> None:
+        """Test from_adjacency_dict restores an exported graph."""
+        graph = from_adjacency_dict(to_adjacency_dict(sample_simple_graph))
+
+        assert graph.vertex_count() == 3
+        assert graph.edge_count() == 2
+        assert graph.get_edge("B", "C").weight == 3.0
+
+    def test_from_adjacency_dict_deduplicates_undirected_pairs(self) -> None:
+        """Test a pair listed from both sides yields a single edge."""
+        data = {"A": {"B": 1.0}, "B": {"A": 1.0, "C": 2.0}}
+
+        graph = from_adjacency_dict(data)
+
+        assert graph.get_vertices() == ["A", "B", "C"]
+        assert graph.edge_count() == 2
+
+
+class TestRepresentationConverter:
+    """Test switching graph storage strategies."""
+
+    def test_convert_to_matrix(self, sample_simple_graph: SimpleGraph) -> None:
+        """Test converting preserves structure in a new graph."""
+        converted = RepresentationConverter.convert(sample_simple_graph, "adjacency_matrix")
+
+        assert converted is not sample_simple_graph
+        assert converted._representation.kind == "adjacency_matrix"
+        assert converted.get_edge("A", "B").weight == 5.0
+
+    def test_convert_to_same_representation_returns_graph(
+        self,
+        sample_simple_graph: SimpleGraph,
+    ) -> None:
+        """Test no copy is made when the representation already matches."""
+        converted = RepresentationConverter.convert(sample_simple_graph, "adjacency_list")
+
+        assert converted is sample_simple_graph
+
+    def test_convert_multigraph_to_adjacency_list_copies(
+        self,
+        sample_multigraph: Multigraph,
+    ) -> None:
+        """Test multigraph storage is not mistaken for a plain adjacency list."""
+        assert sample_multigraph._representation.kind == "multigraph"
+
+        converted = RepresentationConverter.convert(sample_multigraph, "adjacency_list")
+
+        assert converted is not sample_multigraph
+        assert converted.edge_count() == 2
+        assert RepresentationConverter.convert(sample_multigraph, "multigraph") is sample_multigraph
@@ -0,0 +1,54 @@
+"""
+Unit tests for GraphFactory.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from packages.graphs.factory import GraphFactory
+from packages.graphs.hypergraph import Hypergraph
+from packages.graphs.multigraph import Multigraph
+from packages.graphs.pseudograph import Pseudograph
+from packages.graphs.simple_graph import SimpleGraph
+
+
+class TestCreateGraph:
+    """Test dispatching on graph type names."""
+
+    @pytest.mark.parametrize(
+        ("graph_type", "expected"),
+        [("simple", SimpleGraph), ("Multi", Multigraph), ("PSEUDO", Pseudograph)],
+    )
+    def test_creates_requested_type(self, graph_type: str, expected: type) -> None:
+        """Test type names are matched case-insensitively."""
+        graph = GraphFactory.create_graph(graph_type, directed=True)
+
+        assert type(graph) is expected
+        assert graph.is_directed()
+
+    @pytest.mark.parametrize("representation", ["adjacency_list", "hypergraph"])
+    def test_creates_undirected_hypergraph(self, representation: str) -> None:
+        """Test hypergraphs are created with their own undirected storage."""
+        graph = GraphFactory.create_graph("hyper", representation=representation)
+
+        assert isinstance(graph, Hypergraph)
+        assert not graph.is_directed()
+
+    @pytest.mark.parametrize(
+        ("options", "match"),
+        [({"directed": True}, "undirected"), ({"representation": "edge_list"}, "edge_list")],
+    )
+    def test_hypergraph_unsupported_options_raise(
+        self,
+        options: dict[str, object],
+        match: str,
+    ) -> None:
+        """Test direction and other representations are rejected for hypergraphs."""
+        with pytest.raises(ValueError, match=match):
+            GraphFactory.create_graph("hyper", **options)
+
+    def test_unknown_type_raises(self) -> None:
+        """Test unknown type names are rejected."""
+        with pytest.raises(ValueError, match="Unknown graph type"):
+            GraphFactory.create_graph("tree")
@@ -0,0 +1,195 @@
+"""
+Unit tests for Hypergraph.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from packages.graphs.hypergraph import Hyperedge, Hypergraph
+from packages.representations.incidence_matrix import to_incidence_matrix
+
+
+class TestHyperedgeLookup:
+    """Test lookups by exact vertex set."""
+
+    def test_has_edge_matches_exact_pair(self, sample_hypergraph: Hypergraph) -> None:
+        """Test only a hyperedge over exactly {source, target} counts."""
+        assert sample_hypergraph.has_edge("A", "B")
+        assert sample_hypergraph.has_edge("B", "A")
+        assert not sample_hypergraph.has_edge("B", "C")
+
+    def test_get_hyperedge_by_vertices(self, sample_hypergraph: Hypergraph) -> None:
+        """Test lookup ignores vertex order."""
+        hyperedge = sample_hypergraph.get_hyperedge_by_vertices(["D", "C", "B"])
+
+        assert hyperedge.weight == 2.0
+
+    def test_get_hyperedge_by_vertices_missing_raises(
+        self,
+        sample_hypergraph: Hypergraph,
+    ) -> None:
+        """Test an unknown vertex set raises KeyError."""
+        with pytest.raises(KeyError):
+            sample_hypergraph.get_hyperedge_by_vertices({"A", "C"})
+
+    def test_index_follows_vertex_removal(self, sample_hypergraph: Hypergraph) -> None:
+        """Test hyperedges removed with a vertex disappear from the index."""
+        sample_hypergraph.remove_vertex("A")
+
+        assert not sample_hypergraph.has_edge("A", "B")
+        assert sample_hypergraph.has_edge("B", "C") is False
+        assert sample_hypergraph.get_hyperedge_by_vertices({"B", "C", "D"}).weight == 2.0
+
+
+class TestHyperedge:
+    """Test Hyperedge construction."""
+
+    def test_vertices_stored_as_frozenset(self) -> None:
+        """Test any iterable of ids is frozen and hashed by vertex set."""
+        from_list = Hyperedge(["A", "B", "C"])
+        from_set = Hyperedge({"C", "B", "A"})
+
+        assert isinstance(from_list.vertices, frozenset)
+        assert from_list == from_set
+        assert hash(from_list) == hash(from_set)
+
+    def test_too_few_distinct_vertices_raises(self) -> None:
+        """Test duplicates collapse before the size check."""
+        with pytest.raises(ValueError, match="at least 2"):
+            Hyperedge(["A", "A"])
+
+
+class TestHypergraphBulkBuild:
+    """Test building and exporting hypergraphs in bulk."""
+
+    def test_from_edge_list(self) -> None:
+        """Test vertices are created from the edges and weights applied."""
+        hyper = Hypergraph.from_edge_list([("A", "B"), ("B", "C", "D")], weights=[1.0, 2.5])
+
+        assert hyper.get_vertices() == ["A", "B", "C", "D"]
+        assert hyper.hyperedge_count() == 2
+        assert hyper.get_hyperedge_by_vertices({"B", "C", "D"}).weight == 2.5
+        assert hyper.degree("B") == 2
+
+    def test_bulk_load_rejects_unknown_vertex(self, sample_hypergraph: Hypergraph) -> None:
+        """Test a hyperedge over a missing vertex stores nothing."""
+        with pytest.raises(KeyError, match="Z"):
+            sample_hypergraph.bulk_load([], [Hyperedge({"A", "B"}), Hyperedge({"A", "Z"})])
+
+        assert sample_hypergraph.hyperedge_count() == 2
+
+    def test_to_csr(self, sample_hypergraph: Hypergraph) -> None:
+        """Test each CSR row holds the positions of one hyperedge's vertices."""
+        indptr, indices = sample_hypergraph.to_csr()
+
+        assert indptr.tolist() == [0, 2, 5]
+        assert sorted(indices[0:2].tolist()) == [0, 1]
+        assert sorted(indices[2:5].tolist()) == [1, 2, 3]
+
+    def test_incidence_matrix(self, sample_hypergraph: Hypergraph) -> None:
+        """Test the incidence matrix marks vertex membership per column."""
+        matrix = to_incidence_matrix(sample_hypergraph)
+
+        assert matrix.tolist() == [[1, 0], [1, 1], [0, 1], [0, 1]]
+
+    def test_sparse_incidence_is_cached_until_mutation(
+        self,
+        sample_hypergraph: Hypergraph,
+    ) -> None:
+        """Test the sparse matrix is reused and rebuilt after a change."""
+        first = sample_hypergraph.to_sparse_incidence()
+
+        assert sample_hypergraph.to_sparse_incidence() is first
+        assert first.toarray().tolist() == [[1, 1, 0, 0], [0, 1, 1, 1]]
+
+        sample_hypergraph.add_hyperedge({"A", "D"})
+
+        assert sample_hypergraph.to_sparse_incidence().shape == (3, 4)
+
+    def test_sparse_incidence_is_read_only(self, sample_hypergraph: Hypergraph) -> None:
+        """Test writes to the cached matrix fail instead of corrupting later results."""
+        incidence = sample_hypergraph.to_sparse_incidence()
+
+        for array in (incidence.data, incidence.indices, incidence.indptr):
+            with pytest.raises(ValueError, match="read-only"):
+                array[:] = 7
+        assert sample_hypergraph.to_sparse_overlap().toarray().tolist() == [[2, 1], [1, 3]]
+
+    def test_sparse_adjacency_counts_shared_hyperedges(
+        self,
+        sample_hypergraph: Hypergraph,
+    ) -> None:
+        """Test off-diagonal entries count shared hyperedges."""
+        sample_hypergraph.add_hyperedge({"B", "C"})
+
+        adjacency = sample_hypergraph.to_sparse_adjacency().toarray()
+
+        assert adjacency.tolist() == [
+            [0, 1, 0, 0],
+            [1, 0, 2, 1],
+            [0, 2, 0, 1],
+            [0, 1, 1, 0],
+        ]
+
+    def test_sparse_overlap_counts_shared_vertices(
+        self,
+        sample_hypergraph: Hypergraph,
+    ) -> None:
+        """Test entries count shared vertices, with sizes on the diagonal."""
+        sample_hypergraph.add_hyperedge({"C", "D"})
+
+        overlap = sample_hypergraph.to_sparse_overlap().toarray()
+
+        assert overlap.tolist() == [[2, 1, 0], [1, 3, 2], [0, 2, 2]]
+
+
+class TestHypergraphDegree:
+    """Test vertex degree queries."""
+
+    def test_degree_counts_parallel_hyperedges(self, sample_hypergraph: Hypergraph) -> None:
+        """Test two hyperedges over the same vertex set both count."""
+        sample_hypergraph.add_hyperedge({"A", "B"})
+
+        assert sample_hypergraph.degree("A") == 2
+        assert sample_hypergraph.degree("B") == 3
+
+    def test_degree_missing_vertex_raises(self, sample_hypergraph: Hypergraph) -> None:
+        """Test an unknown vertex raises KeyError."""
+        with pytest.raises(KeyError):
+            sample_hypergraph.degree("Z")
+
+    def test_degree_array_cached_until_mutation(self, sample_hypergraph: Hypergraph) -> None:
+        """Test the degree vector is reused and rebuilt after a change."""
+        first = sample_hypergraph.degree_array()
+
+        assert first.tolist() == [1, 2, 1, 1]
+        assert sample_hypergraph.degree_array() is first
+
+        sample_hypergraph.remove_vertex("B")
+
+        assert sample_hypergraph.degree_array().tolist() == [0, 0, 0]
+
+    def test_degree_array_is_read_only(self, sample_hypergraph: Hypergraph) -> None:
+        """Test callers cannot corrupt the cached degrees."""
+        degrees = sample_hypergraph.degree_array()
+
+        with pytest.raises(ValueError, match="read-only"):
+            degrees[0] = 99
+        assert sample_hypergraph.degree_array().tolist() == [1, 2, 1, 1]
+
+    def test_iter_incident_hyperedges(self, sample_hypergraph: Hypergraph) -> None:
+        """Test the lazy iterator yields every incident hyperedge."""
+        sample_hypergraph.add_hyperedge({"A", "B"}, weight=4.0)
+
+        weights = sorted(h.weight for h in sample_hypergraph.iter_incident_hyperedges("B"))
+
+        assert weights == [1.0, 2.0, 4.0]
+
+    def test_iter_incident_hyperedges_missing_raises_on_call(
+        self,
+        sample_hypergraph: Hypergraph,
+    ) -> None:
+        """Test an unknown vertex fails before iteration starts."""
+        with pytest.raises(KeyError):
+            sample_hypergraph.iter_incident_hyperedges("Z")
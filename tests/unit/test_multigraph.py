@@ -0,0 +1,189 @@
+"""
+Unit tests for Multigraph.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from packages.graphs.multigraph import Multigraph
+
+
+class TestMultigraphRepresentation:
+    """Test selecting the multigraph storage."""
+
+    @pytest.mark.parametrize("representation", ["adjacency_list", "multigraph"])
+    def test_accepted_names(self, representation: str) -> None:
+        """Test both accepted names select the multigraph storage."""
+        multi = Multigraph(representation=representation)
+
+        assert multi._representation.kind == "multigraph"
+
+    def test_unsupported_name_lists_accepted_names(self) -> None:
+        """Test the error names every accepted representation."""
+        with pytest.raises(ValueError, match="adjacency_list, multigraph"):
+            Multigraph(representation="edge_list")
+
+
+class TestMultigraphRemoval:
+    """Test removing vertices and edges with parallel edges present."""
+
+    def test_remove_vertex_drops_incident_edges(self, sample_multigraph: Multigraph) -> None:
+        """Test all parallel edges and adjacency entries go with the vertex."""
+        sample_multigraph.add_vertex("C")
+        sample_multigraph.add_edge("B", "C", weight=1.0)
+
+        sample_multigraph.remove_vertex("A")
+
+        assert sample_multigraph.edge_count() == 1
+        assert sample_multigraph.get_neighbors("B") == {"C"}
+        assert not sample_multigraph.has_edge("B", "A")
+
+    def test_remove_vertex_directed(self) -> None:
+        """Test edges pointing into the removed vertex are purged."""
+        multi = Multigraph(directed=True)
+        for vertex_id in ("A", "B", "C"):
+            multi.add_vertex(vertex_id)
+        multi.add_edge("A", "B")
+        multi.add_edge("A", "B")
+        multi.add_edge("B", "C")
+
+        multi.remove_vertex("B")
+
+        assert multi.edge_count() == 0
+        assert multi.get_neighbors("A") == set()
+
+    def test_remove_edge_then_vertex(self, sample_multigraph: Multigraph) -> None:
+        """Test the incidence index stays consistent after edge removal."""
+        sample_multigraph.remove_edge("A", "B")
+        sample_multigraph.remove_vertex("B")
+
+        assert sample_multigraph.edge_count() == 0
+        assert sample_multigraph.get_neighbors("A") == set()
+
+
+class TestEdgeMultiplicity:
+    """Test parallel edge counting."""
+
+    def test_counts_parallel_edges(self, sample_multigraph: Multigraph) -> None:
+        """Test undirected multiplicity is the same from either end."""
+        assert sample_multigraph.edge_multiplicity("A", "B") == 2
+        assert sample_multigraph.edge_multiplicity("B", "A") == 2
+
+    def test_directed_counts_one_orientation(self) -> None:
+        """Test directed multiplicity only counts source -> target."""
+        multi = Multigraph(directed=True)
+        multi.add_vertex("A")
+        multi.add_vertex("B")
+        multi.add_edge("A", "B")
+
+        assert multi.edge_multiplicity("A", "B") == 1
+        assert multi.edge_multiplicity("B", "A") == 0
+        assert not multi.has_edge("B", "A")
+
+    def test_removal_decrements(self, sample_multigraph: Multigraph) -> None:
+        """Test has_edge stays true until the last parallel edge is removed."""
+        sample_multigraph.remove_edge("A", "B")
+        assert sample_multigraph.edge_multiplicity("A", "B") == 1
+        assert sample_multigraph.has_edge("B", "A")
+
+        sample_multigraph.remove_edge("A", "B")
+        assert sample_multigraph.edge_multiplicity("A", "B") == 0
+        assert not sample_multigraph.has_edge("A", "B")
+
+
+class TestPairLookup:
+    """Test edge lookups by endpoint pair."""
+
+    def test_get_edge_returns_first_parallel_edge(self, sample_multigraph: Multigraph) -> None:
+        """Test the earliest added parallel edge is returned from either end."""
+        assert sample_multigraph.get_edge("A", "B").weight == 3.0
+        assert sample_multigraph.get_edge("B", "A").weight == 3.0
+
+    def test_get_edges_between_keeps_insertion_order(
+        self,
+        sample_multigraph: Multigraph,
+    ) -> None:
+        """Test all parallel edges are listed oldest first."""
+        weights = [edge.weight for edge in sample_multigraph.get_edges_between("B", "A")]
+
+        assert weights == [3.0, 5.0]
+
+    def test_remove_edge_reversed_pair_undirected(self, sample_multigraph: Multigraph) -> None:
+        """Test an undirected edge can be removed by naming its endpoints reversed."""
+        sample_multigraph.remove_edge("B", "A")
+
+        assert sample_multigraph.get_edge("A", "B").weight == 5.0
+        assert sample_multigraph.edge_multiplicity("A", "B") == 1
+
+    def test_index_follows_vertex_removal(self, sample_multigraph: Multigraph) -> None:
+        """Test edges removed with a vertex can no longer be looked up."""
+        sample_multigraph.remove_vertex("B")
+        sample_multigraph.add_vertex("B")
+
+        assert sample_multigraph.get_edges_between("A", "B") == []
+        with pytest.raises(KeyError):
+            sample_multigraph.get_edge("A", "B")
+
+
+class TestMultigraphCsr:
+    """Test exporting adjacency as CSR arrays."""
+
+    def test_undirected_rows_list_both_ends(self, sample_multigraph: Multigraph) -> None:
+        """Test parallel edges stay separate and appear from both endpoints."""
+        indptr, indices, data = sample_multigraph.to_csr()
+
+        assert indptr.tolist() == [0, 2, 4]
+        assert indices.tolist() == [1, 1, 0, 0]
+        assert data.tolist() == [3.0, 5.0, 3.0, 5.0]
+
+    def test_directed_rows_hold_out_edges(self) -> None:
+        """Test a directed graph lists each edge once, under its source."""
+        multi = Multigraph(directed=True)
+        for vertex_id in ("A", "B", "C"):
+            multi.add_vertex(vertex_id)
+        multi.add_edge("C", "A", weight=2.0)
+        multi.add_edge("A", "B", weight=1.0)
+
+        indptr, indices, data = multi.to_csr()
+
+        assert indptr.tolist() == [0, 1, 1, 2]
+        assert indices.tolist() == [1, 0]
+        assert data.tolist() == [1.0, 2.0]
+
+    def test_cached_until_mutation(self, sample_multigraph: Multigraph) -> None:
+        """Test the arrays are reused and rebuilt after an edge is removed."""
+        indptr, indices, data = sample_multigraph.to_csr()
+        again = sample_multigraph.to_csr()
+
+        assert again[0] is indptr
+        assert again[1] is indices
+        assert again[2] is data
+
+        sample_multigraph.remove_edge("A", "B")
+
+        assert sample_multigraph.to_csr()[2].tolist() == [5.0, 5.0]
+
+    def test_cached_arrays_are_read_only(self, sample_multigraph: Multigraph) -> None:
+        """Test callers cannot corrupt the cache by writing to the arrays."""
+        indptr, indices, data = sample_multigraph.to_csr()
+
+        for array in (indptr, indices, data):
+            assert not array.flags.writeable
+        with pytest.raises(ValueError, match="read-only"):
+            data[0] = 0.0
+
+    def test_float32_weights(self, sample_multigraph: Multigraph) -> None:
+        """Test the data array can be requested in single precision."""
+        data = sample_multigraph.to_csr(np.float32)[2]
+
+        assert data.dtype == np.float32
+        assert sample_multigraph.to_csr()[2].dtype == np.float64
+
+    def test_sparse_adjacency_sums_parallel_edges(self, sample_multigraph: Multigraph) -> None:
+        """Test parallel weights are summed into one float32 entry."""
+        adjacency = sample_multigraph.to_sparse_adjacency()
+
+        assert adjacency.dtype == np.float32
+        assert adjacency.toarray().tolist() == [[0.0, 8.0], [8.0, 0.0]]
@@ -116,6 +116,19 @@ class TestNetworkXAdapter:
         assert edge_ab.weight == 5.0
         assert edge_ab.attributes["relation"] == "parent"
 
+    def test_roundtrip_keeps_attributes_named_attributes(self) -> None:
+        """Test a metadata key called "attributes" is kept as ordinary metadata."""
+        graph = SimpleGraph()
+        graph.add_vertex("A", attributes={"attributes": {"z": 1}})
+        graph.add_vertex("B")
+        graph.add_edge("A", "B", weight=2.0, attributes={"attributes": "x"})
+
+        restored = NetworkXAdapter.from_networkx(NetworkXAdapter.to_networkx(graph))
+
+        assert restored.get_vertex("A").attributes == {"attributes": {"z": 1}}
+        assert restored.get_edge("A", "B").attributes == {"attributes": "x"}
+        assert restored.get_edge("A", "B").weight == 2.0
+
     def test_roundtrip_conversion(self, sample_graph: SimpleGraph) -> None:
         """Test that our_graph -> NetworkX -> our_graph preserves structure."""
         # Convert to NetworkX and back
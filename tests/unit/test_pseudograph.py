@@ -0,0 +1,91 @@
+"""
+Unit tests for Pseudograph.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from packages.observers.change_tracker import ChangeLogger
+
+if TYPE_CHECKING:
+    from packages.graphs.pseudograph import Pseudograph
+
+
+class TestSelfLoopTracking:
+    """Test self-loop counts kept in step with mutations."""
+
+    def test_counts_follow_additions(self, sample_pseudograph: Pseudograph) -> None:
+        """Test per-vertex and total counts include parallel loops."""
+        sample_pseudograph.add_edge("A", "A", weight=3.0)
+        sample_pseudograph.add_edge("B", "B")
+
+        assert sample_pseudograph.self_loop_count("A") == 2
+        assert sample_pseudograph.has_self_loop("B")
+        assert sample_pseudograph.count_self_loops() == 3
+
+    def test_remove_edge_decrements(self, sample_pseudograph: Pseudograph) -> None:
+        """Test removing the last loop clears has_self_loop."""
+        sample_pseudograph.remove_edge("A", "A")
+
+        assert not sample_pseudograph.has_self_loop("A")
+        assert sample_pseudograph.count_self_loops() == 0
+
+    def test_remove_vertex_drops_loops(self, sample_pseudograph: Pseudograph) -> None:
+        """Test loops go away with their vertex."""
+        sample_pseudograph.remove_vertex("A")
+
+        assert sample_pseudograph.count_self_loops() == 0
+        assert sample_pseudograph.self_loop_count("A") == 0
+
+    def test_total_degree_counts_loops_twice(self, sample_pseudograph: Pseudograph) -> None:
+        """Test a loop adds two and the vertex is not also counted as its own neighbor."""
+        assert sample_pseudograph.total_degree("A") == 3
+        assert sample_pseudograph.total_degree("B") == 1
+
+    def test_remove_all_self_loops(self, sample_pseudograph: Pseudograph) -> None:
+        """Test every loop is removed and ordinary edges are kept."""
+        sample_pseudograph.add_edge("A", "A")
+        sample_pseudograph.add_edge("B", "B")
+
+        assert sample_pseudograph.remove_all_self_loops() == 3
+        assert sample_pseudograph.count_self_loops() == 0
+        assert sample_pseudograph.edge_count() == 1
+
+    def test_all_vertex_queries_match_per_vertex(self, sample_pseudograph: Pseudograph) -> None:
+        """Test the whole-graph variants agree with the per-vertex methods."""
+        sample_pseudograph.add_vertex("C")
+        sample_pseudograph.add_edge("A", "A")
+        sample_pseudograph.add_edge("B", "C")
+
+        assert sample_pseudograph.self_loop_counts_all() == {"A": 2}
+        assert sample_pseudograph.total_degrees_all() == {
+            vertex_id: sample_pseudograph.total_degree(vertex_id)
+            for vertex_id in ("A", "B", "C")
+        }
+
+    def test_remove_all_self_loops_keeps_indexes_consistent(
+        self,
+        sample_pseudograph: Pseudograph,
+    ) -> None:
+        """Test lookups and later removals still work after the bulk removal."""
+        sample_pseudograph.add_edge("A", "A")
+        sample_pseudograph.remove_all_self_loops()
+
+        assert not sample_pseudograph.has_edge("A", "A")
+        assert sample_pseudograph.get_neighbors("A") == {"B"}
+        assert sample_pseudograph.to_csr()[0].tolist() == [0, 1, 2]
+
+        sample_pseudograph.remove_vertex("A")
+
+        assert sample_pseudograph.edge_count() == 0
+
+    def test_remove_all_self_loops_notifies_once(self, sample_pseudograph: Pseudograph) -> None:
+        """Test observers see one summary event for the whole removal."""
+        logger = ChangeLogger()
+        sample_pseudograph.add_edge("A", "A")
+        sample_pseudograph.attach_observer(logger)
+
+        sample_pseudograph.remove_all_self_loops()
+
+        assert logger.get_history() == [("bulk_mutated", (0, -2))]
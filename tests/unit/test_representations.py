@@ -0,0 +1,147 @@
+"""
+Unit tests for graph representations.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from packages.core.edge import Edge
+from packages.core.vertex import Vertex
+from packages.graphs.simple_graph import SimpleGraph
+from packages.representations.adjacency_matrix import (
+    AdjacencyMatrixRepresentation,
+    to_adjacency_matrix,
+)
+
+if TYPE_CHECKING:
+    from packages.graphs.multigraph import Multigraph
+
+
+class TestToAdjacencyMatrix:
+    """Test to_adjacency_matrix export."""
+
+    def test_undirected_matrix_is_symmetric(self, sample_simple_graph: SimpleGraph) -> None:
+        """Test undirected edges fill both cells."""
+        matrix = to_adjacency_matrix(sample_simple_graph)
+
+        expected = np.array([
+            [0.0, 5.0, 0.0],
+            [5.0, 0.0, 3.0],
+            [0.0, 3.0, 0.0],
+        ])
+        np.testing.assert_array_equal(matrix, expected)
+
+    def test_directed_matrix(self) -> None:
+        """Test directed edges fill only the source row."""
+        graph = SimpleGraph(directed=True)
+        graph.add_vertex("A")
+        graph.add_vertex("B")
+        graph.add_edge("A", "B", weight=2.0)
+
+        matrix = to_adjacency_matrix(graph)
+
+        assert matrix[0, 1] == 2.0
+        assert matrix[1, 0] == 0.0
+
+    def test_parallel_edges_keep_first_weight(self, sample_multigraph: Multigraph) -> None:
+        """Test that the first parallel edge determines the cell value."""
+        matrix = to_adjacency_matrix(sample_multigraph)
+
+        assert matrix[0, 1] == 3.0
+        assert matrix[1, 0] == 3.0
+
+    def test_empty_graph(self, empty_simple_graph: SimpleGraph) -> None:
+        """Test converting an empty graph."""
+        assert to_adjacency_matrix(empty_simple_graph).shape == (0, 0)
+
+
+class TestGetEdgeWeight:
+    """Test reading edge weights through the representation."""
+
+    def test_matrix_reads_cell(self) -> None:
+        """Test the matrix representation returns the stored weight."""
+        graph = SimpleGraph(representation="adjacency_matrix")
+        graph.add_vertex("A")
+        graph.add_vertex("B")
+        graph.add_edge("A", "B", weight=4.5)
+
+        assert graph.get_edge_weight("A", "B") == 4.5
+        assert graph.get_edge_weight("B", "A") == 4.5
+
+    def test_missing_edge_raises(self, sample_simple_graph: SimpleGraph) -> None:
+        """Test a missing edge raises KeyError."""
+        with pytest.raises(KeyError):
+            sample_simple_graph._representation.get_edge_weight("A", "C")
+
+
+class TestAdjacencyMatrixBulkLoad:
+    """Test the vectorized bulk_load on the matrix representation."""
+
+    def test_matches_incremental_build(self, sample_simple_graph: SimpleGraph) -> None:
+        """Test bulk loading fills the same cells as add_edge."""
+        graph = SimpleGraph(representation="adjacency_matrix")
+        graph.bulk_load(sample_simple_graph.vertices(), sample_simple_graph.edges())
+
+        np.testing.assert_array_equal(
+            to_adjacency_matrix(graph),
+            to_adjacency_matrix(sample_simple_graph),
+        )
+        assert graph.edge_count() == 2
+        assert graph.get_edge_weight("C", "B") == 3.0
+
+    def test_duplicate_in_batch_stores_nothing(self) -> None:
+        """Test a duplicate edge rejects the whole edge batch."""
+        representation = AdjacencyMatrixRepresentation(directed=False)
+        vertices = [Vertex(id="A"), Vertex(id="B")]
+        edges = [Edge(source="A", target="B"), Edge(source="B", target="A")]
+
+        with pytest.raises(ValueError, match="already exists"):
+            representation.bulk_load(vertices, edges)
+
+        assert representation.edge_count() == 0
+        assert not representation.has_edge("A", "B")
+
+
+class TestCSRSnapshot:
+    """Test the frozen CSR view of a graph."""
+
+    def test_undirected_rows(self, sample_simple_graph: SimpleGraph) -> None:
+        """Test each undirected edge appears from both endpoints."""
+        frozen = sample_simple_graph.freeze()
+        neighbors = dict(
+            zip(frozen.neighbor_ids("B"), frozen.neighbor_weights("B").tolist(), strict=True)
+        )
+
+        assert frozen.vertex_ids == ("A", "B", "C")
+        assert neighbors == {"A": 5.0, "C": 3.0}
+        assert frozen.degrees().tolist() == [1, 2, 1]
+
+    def test_directed_rows_hold_out_neighbors(self) -> None:
+        """Test a directed edge is listed under its source only."""
+        graph = SimpleGraph(directed=True)
+        graph.add_vertex("A")
+        graph.add_vertex("B")
+        graph.add_edge("B", "A")
+
+        frozen = graph.freeze()
+
+        assert frozen.degree("A") == 0
+        assert frozen.neighbors("B").tolist() == [0]
+
+    def test_snapshot_is_read_only_and_detached(self, sample_simple_graph: SimpleGraph) -> None:
+        """Test views cannot be written and later mutations are not seen."""
+        frozen = sample_simple_graph.freeze()
+        sample_simple_graph.remove_edge("A", "B")
+
+        assert frozen.degree("A") == 1
+        with pytest.raises(ValueError, match="read-only"):
+            frozen.neighbors("A")[0] = 2
+
+    def test_unknown_vertex_raises(self, sample_simple_graph: SimpleGraph) -> None:
+        """Test queries for a missing vertex raise KeyError."""
+        with pytest.raises(KeyError):
+            sample_simple_graph.freeze().neighbors("Z")
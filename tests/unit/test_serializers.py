@@ -165,6 +165,21 @@ class TestJSONSerializer:
         assert isinstance(loaded, SimpleGraph)
         assert loaded.vertex_count() == 2
 
+    def test_loads_rejects_malformed_document(self) -> None:
+        """Test that schema errors are reported before any graph is built."""
+        with pytest.raises(ValueError, match="weight"):
+            JSONSerializer.loads(
+                '{"graph_type": "SimpleGraph", "edges": '
+                '[{"source": "A", "target": "B", "weight": "heavy"}]}'
+            )
+
+    def test_load_rejects_malformed_file(self, temp_json_file: Path) -> None:
+        """Test that load validates the file against the document schema."""
+        temp_json_file.write_text('{"directed": true}', encoding="utf-8")
+
+        with pytest.raises(ValueError, match="graph_type"):
+            JSONSerializer.load(temp_json_file)
+
     def test_indent_parameter(
         self,
         sample_graph: SimpleGraph,
@@ -42,6 +42,31 @@ class TestSimpleGraphBasics:
         assert graph.has_edge("B", "C")
         assert graph.edge_count() == 2
 
+    def test_add_vertex_attributes_dict_is_not_copied(
+        self,
+        empty_simple_graph: SimpleGraph,
+    ) -> None:
+        """Test an explicit attributes dict is stored as given."""
+        attributes = {"color": "red"}
+        empty_simple_graph.add_vertex("A", attributes=attributes)
+
+        assert empty_simple_graph.get_vertex("A").attributes is attributes
+
+    def test_add_edge_merges_keyword_attributes(self, sample_simple_graph: SimpleGraph) -> None:
+        """Test keyword metadata is merged over an explicit dict."""
+        sample_simple_graph.add_edge(
+            "A", "C", attributes={"label": "x", "kind": "road"}, label="y"
+        )
+
+        assert sample_simple_graph.get_edge("A", "C").attributes == {"label": "y", "kind": "road"}
+
+    def test_non_mapping_attributes_raises(self, empty_simple_graph: SimpleGraph) -> None:
+        """Test attributes= must be a mapping rather than any metadata value."""
+        with pytest.raises(TypeError, match="mapping"):
+            empty_simple_graph.add_vertex("A", attributes="x")
+
+        assert not empty_simple_graph.has_vertex("A")
+
     def test_add_self_loop_raises(self, empty_simple_graph: SimpleGraph) -> None:
         """Test that self-loops are rejected in simple graphs."""
         graph = empty_simple_graph
@@ -69,6 +94,18 @@ class TestSimpleGraphBasics:
         with pytest.raises(VertexNotFoundError):
             empty_simple_graph.remove_vertex("Z")
 
+    @pytest.mark.parametrize("representation", ["adjacency_list", "adjacency_matrix", "edge_list"])
+    def test_add_edge_missing_vertex_raises(self, representation: str) -> None:
+        """Test every representation reports a missing endpoint the same way."""
+        graph = SimpleGraph(representation=representation)
+        graph.add_vertex("A")
+
+        with pytest.raises(VertexNotFoundError, match="Target vertex 'Z'"):
+            graph.add_edge("A", "Z")
+        with pytest.raises(VertexNotFoundError, match="Source vertex 'Z'"):
+            graph.add_edge("Z", "A")
+        assert graph.edge_count() == 0
+
     def test_get_neighbors(self, sample_simple_graph: SimpleGraph) -> None:
         """Test getting neighbors."""
         graph = sample_simple_graph
@@ -115,6 +152,18 @@ class TestSimpleGraphRepresentations:
         assert graph.has_edge("A", "B")
         assert graph.has_edge("B", "C")
 
+    def test_convert_to_same_representation_is_noop(
+        self,
+        sample_simple_graph: SimpleGraph,
+    ) -> None:
+        """Test that converting to the current representation keeps it."""
+        graph = sample_simple_graph
+        representation = graph._representation
+
+        graph.convert_representation("adjacency_list")
+
+        assert graph._representation is representation
+
 
 class TestSimpleGraphConversions:
     """Test graph type conversions."""
@@ -0,0 +1,151 @@
+"""
+Unit tests for Vertex and Edge models.
+"""
+
+from __future__ import annotations
+
+import pickle
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from packages.core.edge import Edge
+from packages.core.vertex import Vertex
+
+
+class TestVertex:
+    """Test Vertex construction and identity."""
+
+    def test_strips_whitespace_from_id(self) -> None:
+        """Test string IDs are normalized."""
+        assert Vertex(id="  A ").id == "A"
+
+    def test_string_id_is_interned(self) -> None:
+        """Test equal ids built at runtime share one object."""
+        first = Vertex(id="".join(["node", "-1"]))
+        second = Vertex(id="".join(["node", "-", "1"]))
+
+        assert first.id is second.id
+
+    def test_empty_id_raises(self) -> None:
+        """Test that blank string IDs are rejected."""
+        with pytest.raises(ValueError, match="empty"):
+            Vertex(id="   ")
+
+    @pytest.mark.parametrize("vertex_id", [None, 1.5, ("A", 1)])
+    def test_non_str_int_id_raises(self, vertex_id: object) -> None:
+        """Test that IDs other than str or int are rejected."""
+        with pytest.raises(ValueError, match="str or int"):
+            Vertex(id=vertex_id)  # type: ignore[type-var]
+
+    def test_is_immutable(self) -> None:
+        """Test that vertices cannot be modified."""
+        vertex = Vertex(id="A")
+
+        with pytest.raises(FrozenInstanceError):
+            vertex.id = "B"  # type: ignore[misc]
+
+    def test_equality_and_hash_use_id_only(self) -> None:
+        """Test vertices with the same ID are interchangeable in sets."""
+        first = Vertex(id="A", attributes={"color": "red"})
+        second = Vertex(id="A")
+
+        assert first == second
+        assert len({first, second}) == 1
+
+    def test_pickle_roundtrip(self) -> None:
+        """Test pickling preserves fields."""
+        vertex = Vertex(id="A", attributes={"color": "red"})
+        hash(vertex)
+
+        restored = pickle.loads(pickle.dumps(vertex))
+
+        assert restored == vertex
+        assert restored.attributes == {"color": "red"}
+        assert hash(restored) == hash(vertex)
+
+
+class TestEdge:
+    """Test Edge construction and identity."""
+
+    def test_integer_weight_coerced_to_float(self) -> None:
+        """Test weights are stored as floats."""
+        weight = Edge(source="A", target="B", weight=2).weight
+
+        assert weight == 2.0
+        assert isinstance(weight, float)
+
+    @pytest.mark.parametrize("weight", [-1.0, float("nan"), "heavy", None])
+    def test_invalid_weight_raises(self, weight: object) -> None:
+        """Test negative, NaN and non-numeric weights are rejected."""
+        with pytest.raises(ValueError, match="weight"):
+            Edge(source="A", target="B", weight=weight)  # type: ignore[arg-type]
+
+    @pytest.mark.parametrize(("source", "target"), [(None, "B"), ("A", 2.5)])
+    def test_non_str_int_endpoint_raises(self, source: object, target: object) -> None:
+        """Test that endpoints other than str or int are rejected."""
+        with pytest.raises(ValueError, match="str or int"):
+            Edge(source=source, target=target)  # type: ignore[type-var]
+
+    def test_directed_flag_validated(self) -> None:
+        """Test 0/1 directed flags become bools and other values are rejected."""
+        assert Edge(source="A", target="B", directed=1).directed is True  # type: ignore[arg-type]
+
+        with pytest.raises(ValueError, match="directed"):
+            Edge(source="A", target="B", directed="yes")  # type: ignore[arg-type]
+
+    def test_undirected_equality_ignores_orientation(self) -> None:
+        """Test A--B equals B--A for undirected edges."""
+        forward = Edge(source="A", target="B")
+        backward = Edge(source="B", target="A")
+
+        assert forward == backward
+        assert hash(forward) == hash(backward)
+
+    def test_directed_equality_respects_orientation(self) -> None:
+        """Test A->B differs from B->A for directed edges."""
+        assert Edge(source="A", target="B", directed=True) != Edge(
+            source="B", target="A", directed=True
+        )
+
+    def test_direction_is_part_of_equality(self) -> None:
+        """Test a directed edge never equals an undirected one."""
+        assert Edge(source="A", target="B", directed=True) != Edge(source="A", target="B")
+        assert Edge(source="A", target="A") == Edge(source="A", target="A")
+
+    def test_getitem_reads_fields_then_attributes(self) -> None:
+        """Test dictionary-style access."""
+        edge = Edge(source="A", target="B", weight=3.0, attributes={"label": "x"})
+
+        assert edge["weight"] == 3.0
+        assert edge["label"] == "x"
+        with pytest.raises(KeyError):
+            edge["missing"]
+
+    def test_string_endpoints_are_interned(self) -> None:
+        """Test endpoints share the interned vertex id objects."""
+        vertex = Vertex(id="".join(["node", "-1"]))
+        edge = Edge(source="".join(["node", "-", "1"]), target="".join(["node", "-2"]))
+
+        assert edge.source is vertex.id
+
+    def test_pickle_roundtrip(self) -> None:
+        """Test pickling preserves fields."""
+        edge = Edge(source="A", target="B", weight=2.5, directed=True, attributes={"k": 1})
+
+        restored = pickle.loads(pickle.dumps(edge))
+
+        assert restored == edge
+        assert restored.weight == 2.5
+        assert restored.attributes == {"k": 1}
+        assert hash(restored) == hash(edge)
+
+    def test_reverse_swaps_endpoints_and_shares_attributes(self) -> None:
+        """Test reverse keeps weight and reuses the attributes mapping."""
+        edge = Edge(source="A", target="B", weight=2.0, directed=True, attributes={"k": 1})
+
+        reversed_edge = edge.reverse()
+
+        assert (reversed_edge.source, reversed_edge.target) == ("B", "A")
+        assert reversed_edge.weight == 2.0
+        assert reversed_edge.attributes is edge.attributes